@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import logging
 import subprocess
+import sys
 from collections import defaultdict
 from typing import Dict, List, Tuple
 
@@ -48,6 +49,23 @@ def _run(cmd: list[str], cwd: str) -> str:
     return out.stdout
 
 
+def _person_id(name: str, email: str) -> str:
+    """Build the contributor ID for a commit author.
+
+    The ID is interned: it is stored on every Commit, VersionResource and
+    File.contributors entry of that author, so all of them share one string
+    instead of holding a fresh copy per commit.
+
+    Args:
+        name: Author name, used when the email is empty
+        email: Author email
+
+    Returns:
+        Person ID of the form ``repo:person:<email hash or name>``
+    """
+    return sys.intern(f"repo:person:{hash_email(email) or name.replace(' ', '_')}")
+
+
 class HistoryAnalyzer(Analyzer):
     """Analyzer for repository history and contributor metrics.
 
@@ -103,7 +121,7 @@ class HistoryAnalyzer(Analyzer):
         # Get or create author
         name = commit.author.name or "Unknown"
         email = commit.author.email or ""
-        pid = f"repo:person:{hash_email(email) or name.replace(' ', '_')}"
+        pid = _person_id(name, email)
         person = project.contributors.get(pid)
         if not person:
             person = Person(
@@ -337,7 +355,7 @@ class HistoryAnalyzer(Analyzer):
             authors: List of (commit_count, name, email) tuples
         """
         for n_commits, name, email in sorted(authors, reverse=True):
-            pid = f"repo:person:{hash_email(email) or name.replace(' ', '_')}"
+            pid = _person_id(name, email)
             if pid not in project.contributors:
                 project.contributors[pid] = Person(
                     id=pid,
@@ -363,7 +381,7 @@ class HistoryAnalyzer(Analyzer):
             Tuple of (sha, date, person_id) for tracking current commit
         """
         sha, date, author, email, msg = line.split("\t", 4)
-        pid = f"repo:person:{hash_email(email) or author.replace(' ', '_')}"
+        pid = _person_id(author, email)
 
         project.commits.append(
             Commit(id=f"repo:commit:{sha}", message=msg, author_id=pid, ended_at=date)
@@ -241,6 +241,7 @@ def _apply_config(cfg: AnalyzeConfig, cfg_dict: dict) -> AnalyzeConfig:
         "context_file",
         "field33_context",
         "fail_on_issues",
+        "jsonld_pretty",
     ):
         if k in cfg_dict and cfg_dict[k] is not None:
             setattr(cfg, k, cfg_dict[k])
@@ -289,6 +290,7 @@ def structure(
         None, "--field33-context", help="Подключить Field33 контекст"
     ),
     hash_algo: str = typer.Option(None, "--hash", help="sha1|sha256"),
+    pretty: bool = typer.Option(False, "--pretty", help="Отформатировать JSON-LD с отступами"),
 ):
     """Analyze repository structure and code quality.
 
@@ -313,6 +315,7 @@ def structure(
         context_file: Additional JSON-LD context file
         field33_context: Field33-specific context extension
         hash_algo: File checksum algorithm (sha1 or sha256)
+        pretty: Indent JSON-LD output (compact by default)
 
     Example:
         $ repoq structure ./my-repo --md report.md --graphs ./graphs
@@ -333,6 +336,7 @@ def structure(
         context_file=context_file,
         field33_context=field33_context,
         hash_algo=hash_algo,
+        pretty=pretty,
     )
 
 
@@ -353,6 +357,7 @@ def history(
     field33_context: str = typer.Option(
         None, "--field33-context", help="Подключить Field33 контекст"
     ),
+    pretty: bool = typer.Option(False, "--pretty", help="Отформатировать JSON-LD с отступами"),
 ):
     """Analyze repository history and evolution.
 
@@ -372,6 +377,7 @@ def history(
         shapes_dir: Custom shapes directory (defaults to built-in)
         context_file: Additional JSON-LD context file
         field33_context: Field33-specific context extension
+        pretty: Indent JSON-LD output (compact by default)
 
     Example:
         $ repoq history ./my-repo --since "6 months ago" --md history.md
@@ -388,6 +394,7 @@ def history(
         shapes_dir=shapes_dir,
         context_file=context_file,
         field33_context=field33_context,
+        pretty=pretty,
     )
 
 
@@ -418,6 +425,7 @@ def full(
         None, "--fail-on-issues", help="[low|medium|high] — завершить с ошибкой при проблемах"
     ),
     hash_algo: str = typer.Option(None, "--hash", help="sha1|sha256"),
+    pretty: bool = typer.Option(False, "--pretty", help="Отформатировать JSON-LD с отступами"),
 ):
     """Perform comprehensive repository analysis (structure + history).
 
@@ -443,6 +451,7 @@ def full(
         field33_context: Field33-specific context extension
         fail_on_issues: Exit with error if issues found at severity level (low/medium/high)
         hash_algo: File checksum algorithm (sha1 or sha256)
+        pretty: Indent JSON-LD output (compact by default)
 
     Example:
         $ repoq full ./my-repo --md report.md --fail-on-issues high
@@ -465,6 +474,7 @@ def full(
         field33_context=field33_context,
         fail_on_issues=fail_on_issues,
         hash_algo=hash_algo,
+        pretty=pretty,
     )
 
 
@@ -499,6 +509,7 @@ def analyze(
         None, "--fail-on-issues", help="Exit with error on issues: low|medium|high"
     ),
     hash_algo: str = typer.Option(None, "--hash", help="File checksum algorithm: sha1|sha256"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent JSON-LD output"),
 ):
     """Analyze repository quality (comprehensive analysis).
 
@@ -523,6 +534,7 @@ def analyze(
         field33_context: Field33-specific context extension
         fail_on_issues: Exit with error if issues found at severity level
         hash_algo: File checksum algorithm (sha1 or sha256)
+        pretty: Indent JSON-LD output (compact by default)
 
     Examples:
         # Analyze current directory
@@ -560,6 +572,7 @@ def analyze(
         field33_context=field33_context,
         fail_on_issues=fail_on_issues,
         hash_algo=hash_algo,
+        pretty=pretty,
     )
 
 
@@ -668,7 +681,13 @@ def _export_results(
     # JSON-LD export
     from .core.jsonld import dump_jsonld
 
-    dump_jsonld(project, output, context_file=cfg.context_file, field33_context=cfg.field33_context)
+    dump_jsonld(
+        project,
+        output,
+        context_file=cfg.context_file,
+        field33_context=cfg.field33_context,
+        pretty=cfg.jsonld_pretty,
+    )
     print(f"[green]JSON‑LD сохранён в[/green] {output}")
 
     # Markdown report
@@ -752,6 +771,7 @@ def _run_command(
     field33_context: str | None = None,
     fail_on_issues: str | None = None,
     hash_algo: str | None = None,
+    pretty: bool = False,
 ):
     """Orchestrate repository analysis workflow.
 
@@ -780,6 +800,7 @@ def _run_command(
         field33_context: Field33 context extension
         fail_on_issues: Fail on issues at severity level
         hash_algo: File checksum algorithm
+        pretty: Indent JSON-LD output
 
     Raises:
         typer.Exit: If validation fails or issues exceed threshold
@@ -809,6 +830,7 @@ def _run_command(
         field33_context=field33_context,
         fail_on_issues=fail_on_issues,
         hash_algo=hash_algo,
+        jsonld_pretty=pretty,
     )
     cfg = _apply_config(cfg, cfg_dict)
 
@@ -1219,12 +1241,12 @@ def meta_self(
 
         # Save output if requested
         if output:
-            from .core.jsonld import export_to_jsonld
+            from .core.jsonld import to_jsonld
 
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            jsonld_data = export_to_jsonld(project)
+            jsonld_data = to_jsonld(project)
             jsonld_data["meta"] = {
                 "level": level,
                 "target": "self",
@@ -55,6 +55,7 @@ class AnalyzeConfig:
         max_files: Limit maximum files to analyze (default: None)
         md_path: Markdown report output path (default: None)
         jsonld_path: JSON-LD output path (default: "quality.jsonld")
+        jsonld_pretty: Indent JSON-LD output instead of writing compact JSON (default: False)
         graphs_dir: Directory for dependency/coupling graphs (default: None)
         branch: Git branch to analyze (default: None)
         depth: Git clone depth for shallow clones (default: None)
@@ -86,6 +87,7 @@ class AnalyzeConfig:
     max_files: Optional[int] = None
     md_path: Optional[str] = None
     jsonld_path: str = "quality.jsonld"
+    jsonld_pretty: bool = False
     graphs_dir: Optional[str] = None
     branch: Optional[str] = None
     depth: Optional[int] = None
@@ -12,7 +12,7 @@ from __future__ import annotations
 import ast
 import logging
 import re
-from typing import Set
+from typing import Iterator, Set
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,9 @@ JS_IMPORT_RE = re.compile(
     r"^\s*import\s+.*?from\s+['\"]([^'\"]+)['\"]|^\s*require\(['\"]([^'\"]+)['\"]\)", re.MULTILINE
 )
 
+# AST fields holding nested statement lists (ExceptHandler/match_case included)
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
 
 def python_imports(content: str) -> Set[str]:
     """Extract Python import package names from source code.
@@ -55,7 +58,7 @@ def python_imports(content: str) -> Set[str]:
         logger.warning(f"Unexpected error parsing Python imports: {e}")
         return set()
     mods: Set[str] = set()
-    for node in ast.walk(tree):
+    for node in _iter_statements(tree):
         if isinstance(node, ast.Import):
             for alias in node.names:
                 mods.add(alias.name.split(".")[0])
@@ -65,6 +68,24 @@ def python_imports(content: str) -> Set[str]:
     return mods
 
 
+def _iter_statements(tree: ast.Module) -> Iterator[ast.AST]:
+    """Yield every statement in a module, including nested blocks.
+
+    Imports are statements, so only statement lists (bodies of functions,
+    classes, if/try/with/loops, except handlers and match cases) are
+    followed. Unlike ``ast.walk`` this never visits expression nodes, which
+    make up the bulk of a typical AST.
+    """
+    stack = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        yield node
+        for field in _BLOCK_FIELDS:
+            block = getattr(node, field, None)
+            if block:
+                stack.extend(reversed(block))
+
+
 def js_imports(content: str) -> Set[str]:
     """Extract JavaScript/TypeScript package names from source code.
 
@@ -21,23 +21,434 @@ Usage:
     >>> complete.query("SELECT ?commit WHERE { ?commit a repo:Commit }")
 """
 
+import fnmatch
+import itertools
 import logging
-from datetime import datetime
+import math
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, TextIO
 
-import git
-from rdflib import RDF, Graph, Literal, Namespace, URIRef
+from rdflib import RDF, BNode, Graph, Literal, Namespace, URIRef
 from rdflib.namespace import XSD
+from rdflib.term import Node
 
 logger = logging.getLogger(__name__)
 
+# Prefer the OxiGraph (Rust) store when oxrdflib is installed: parsing, graph
+# unions and SPARQL run natively behind the same rdflib Graph API.
+try:
+    import oxrdflib  # noqa: F401
+
+    _GRAPH_STORE = "Oxigraph"
+except ImportError:
+    _GRAPH_STORE = "default"
+
 # Namespaces
 REPO = Namespace("https://repoq.dev/ontology/repo#")
 STORY = Namespace("https://repoq.dev/ontology/story#")
 ADR = Namespace("https://repoq.dev/ontology/adr#")
 CHANGELOG = Namespace("https://repoq.dev/ontology/changelog#")
 
+# Namespace attribute access builds a new URIRef on every lookup, so the terms
+# used in the generators' hot loops are resolved once here.
+_RDF_TYPE = RDF.type
+_XSD_INTEGER = XSD.integer
+_XSD_DATETIME = XSD.dateTime
+
+# Classes
+_REPO_ADDITION = REPO.Addition
+_REPO_AUTHOR = REPO.Author
+_REPO_COMMIT = REPO.Commit
+_REPO_DELETION = REPO.Deletion
+_REPO_FILE = REPO.File
+_REPO_MARKDOWN_FILE = REPO.MarkdownFile
+_REPO_MODIFICATION = REPO.Modification
+_REPO_PYTHON_FILE = REPO.PythonFile
+_REPO_RENAME = REPO.Rename
+_REPO_TTL_FILE = REPO.TTLFile
+_REPO_TEST_CLASS = REPO.TestClass
+_REPO_TEST_FUNCTION = REPO.TestFunction
+_REPO_TEST_SUITE = REPO.TestSuite
+
+# Properties
+_REPO_AUTHOR_PROP = REPO.author
+_REPO_AUTHOR_EMAIL = REPO.authorEmail
+_REPO_AUTHOR_NAME = REPO.authorName
+_REPO_AUTHORED_DATE = REPO.authoredDate
+_REPO_BODY = REPO.body
+_REPO_CHANGES_FILE = REPO.changesFile
+_REPO_COMMITTED_DATE = REPO.committedDate
+_REPO_COMMITTER = REPO.committer
+_REPO_FILE_EXTENSION = REPO.fileExtension
+_REPO_FILE_NAME = REPO.fileName
+_REPO_FILE_PATH = REPO.filePath
+_REPO_FILE_SIZE = REPO.fileSize
+_REPO_HAS_CHANGE = REPO.hasChange
+_REPO_HAS_TEST = REPO.hasTest
+_REPO_LINES_ADDED = REPO.linesAdded
+_REPO_LINES_OF_CODE = REPO.linesOfCode
+_REPO_LINES_REMOVED = REPO.linesRemoved
+_REPO_MESSAGE = REPO.message
+_REPO_PARENT = REPO.parent
+_REPO_SHA = REPO.sha
+_REPO_SHORT_SHA = REPO.shortSha
+_REPO_SUBJECT = REPO.subject
+_REPO_TEST_CLASS_COUNT = REPO.testClassCount
+_REPO_TEST_COUNT = REPO.testCount
+_REPO_TEST_FILE = REPO.testFile
+_REPO_TEST_FUNCTION_COUNT = REPO.testFunctionCount
+_REPO_TEST_NAME = REPO.testName
+_REPO_TEST_NODE_ID = REPO.testNodeId
+
+
+# Authors and parent commits recur across commits; memoize their URIRefs
+# instead of re-validating the same URI strings for every reference.
+_URI_CACHE_SIZE = 1 << 16
+
+
+# Characters that are not valid in an IRI (the OxiGraph store rejects them), plus
+# '%' not starting a percent-escape. Paths and pytest node IDs such as
+# "docs/my notes.py" or "test_x.py::test_y[a|b]" routinely contain them.
+_IRI_UNSAFE = re.compile(r'[\x00-\x20<>"{}|^`\\\[\]]|%(?![0-9A-Fa-f]{2})')
+
+
+def _iri_safe(text: str) -> str:
+    """Percent-encode characters of ``text`` that may not appear in an IRI."""
+    return _IRI_UNSAFE.sub(lambda m: f"%{ord(m.group(0)):02X}", text)
+
+
+@lru_cache(maxsize=_URI_CACHE_SIZE)
+def _commit_uri(sha: str) -> URIRef:
+    return URIRef(f"https://repoq.dev/resource/commit/{sha}")
+
+
+@lru_cache(maxsize=_URI_CACHE_SIZE)
+def _author_uri(email: str) -> URIRef:
+    return URIRef(f"https://repoq.dev/resource/author/{_iri_safe(email)}")
+
+
+def _xsd_datetime(timestamp: int) -> Literal:
+    """Build an xsd:dateTime literal (UTC, ``Z`` suffix) from a Unix timestamp.
+
+    Git timestamps are UTC-based; the lexical form is formatted directly and
+    kept as-is (``normalize=False``) instead of round-tripping through a
+    local-time ``datetime`` per field.
+    """
+    return Literal(
+        time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp)),
+        datatype=_XSD_DATETIME,
+        normalize=False,
+    )
+
+
+Triple = tuple[URIRef, URIRef, "URIRef | BNode | Literal"]
+
+# rdflib formats accepted as N-Triples; these are streamed without a Graph
+_NTRIPLES_FORMATS = frozenset({"nt", "ntriples", "nt11"})
+_NT_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+# Characters IRIREF forbids verbatim (e.g. spaces in file paths) are written as
+# UCHAR escapes, which N-Triples parsers decode back to the original IRI
+_NT_IRI_UNSAFE = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+_NT_IRI_ESCAPES = str.maketrans(
+    {c: f"\\u{ord(c):04X}" for c in (*map(chr, range(0x21)), *'<>"{}|^`\\')}
+)
+
+
+def _nt_iri(iri: str) -> str:
+    """Format an IRI as an N-Triples IRIREF."""
+    if _NT_IRI_UNSAFE.search(iri):
+        iri = iri.translate(_NT_IRI_ESCAPES)
+    return f"<{iri}>"
+
+
+def _nt_term(term: Node) -> str:
+    """Format an RDF term in N-Triples syntax."""
+    if isinstance(term, Literal):
+        lexical = f'"{str(term).translate(_NT_ESCAPES)}"'
+        if term.language:
+            return f"{lexical}@{term.language}"
+        if term.datatype:
+            return f"{lexical}^^{_nt_iri(term.datatype)}"
+        return lexical
+    if isinstance(term, BNode):
+        return f"_:{term}"
+    return _nt_iri(str(term))
+
+
+def _write_ntriples(stream: TextIO, triples: Iterable[tuple[Node, Node, Node]]) -> int:
+    """Write triples to ``stream`` as N-Triples lines.
+
+    Returns:
+        Number of lines written (duplicates are legal N-Triples and not removed)
+    """
+    count = 0
+    for s, p, o in triples:
+        stream.write(f"{_nt_term(s)} {_nt_term(p)} {_nt_term(o)} .\n")
+        count += 1
+    return count
+
+
+def _add_triples(graph: Graph, triples: Iterable[Triple]) -> None:
+    """Add triples to ``graph`` in one batched ``addN`` call."""
+    graph.addN((s, p, o, graph) for s, p, o in triples)
+
+
+def _new_graph() -> Graph:
+    """Create an empty graph backed by the preferred store."""
+    return Graph(store=_GRAPH_STORE)
+
+
+def _compile_name_patterns(patterns: list[str]) -> Optional[re.Pattern[str]]:
+    """Compile glob patterns for single path components into one regex.
+
+    Returns:
+        Alternation of all patterns, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+def _walk_files(root: str, is_excluded: Callable[[str], bool]) -> Iterator[tuple[str, os.DirEntry]]:
+    """Yield ``(relative_path, entry)`` for every file below ``root``.
+
+    Uses an explicit ``os.scandir`` stack instead of ``Path.rglob`` so that the
+    file type (and, once fetched, the stat result) cached on each ``DirEntry``
+    is reused rather than re-stat-ing every path. Entries whose name is
+    excluded are pruned, so excluded directories are never descended.
+
+    Args:
+        root: Directory to walk
+        is_excluded: Predicate on a single path component (file/dir name)
+    """
+    prefix_len = len(os.path.join(root, ""))
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if is_excluded(entry.name):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path[prefix_len:], entry
+        except OSError as e:
+            logger.warning(f"Could not scan directory {current}: {e}")
+
+
+# git log record layout: a \x1e record separator, NUL-separated header
+# fields, then the NUL-delimited --raw/--numstat output of the commit.
+_GIT_LOG_FORMAT = "%x1e%H%x00%P%x00%an%x00%ae%x00%cn%x00%ce%x00%at%x00%ct%x00%B%x00"
+_GIT_LOG_HEADER_FIELDS = 9
+
+# Opt-in parallel Turtle parsing only pays off for large .repoq trees: the parent
+# still re-parses every worker's N-Triples serially (~70% of the serial Turtle
+# time), and each spawned worker imports rdflib. ~4 MiB of Turtle takes ~10 s to
+# parse serially, which keeps pool start-up a small fraction of the total.
+_PARALLEL_PARSE_MIN_BYTES = 4 << 20
+
+
+@dataclass
+class _GitCommit:
+    """Commit record parsed from ``git log`` output."""
+
+    sha: str
+    parents: list[str]
+    author_name: str
+    author_email: str
+    committer_name: str
+    committer_email: str
+    authored_ts: int
+    committed_ts: int
+    message: str
+    # (status letter, old path, new path, lines added, lines removed)
+    changes: list[tuple[str, str, str, Optional[int], Optional[int]]] = field(default_factory=list)
+
+
+def _parse_git_log_changes(
+    diff: str,
+) -> list[tuple[str, str, str, Optional[int], Optional[int]]]:
+    """Parse the ``--raw --numstat -z`` section of a single commit.
+
+    Raw entries (``:mode mode sha sha STATUS``) and numstat entries
+    (``added\tremoved\tpath``) are emitted in the same file order, so the
+    n-th numstat entry belongs to the n-th raw entry.
+    """
+    raw: list[tuple[str, str, str]] = []
+    stats: list[tuple[Optional[int], Optional[int]]] = []
+    tokens = diff.split("\0")
+    i = 0
+    while i < len(tokens):
+        token = tokens[i].strip("\n")
+        if token.startswith(":"):
+            status = token.rsplit(" ", 1)[-1][:1]
+            if status in ("R", "C"):
+                raw.append((status, tokens[i + 1], tokens[i + 2]))
+                i += 3
+            else:
+                raw.append((status, tokens[i + 1], tokens[i + 1]))
+                i += 2
+        elif "\t" in token:
+            added, removed, path = token.split("\t", 2)
+            # Binary files report "-" instead of line counts
+            stats.append(
+                (
+                    int(added) if added.isdigit() else None,
+                    int(removed) if removed.isdigit() else None,
+                )
+            )
+            # Renames/copies leave the path empty and append old and new paths
+            i += 1 if path else 3
+        else:
+            i += 1
+
+    stats.extend([(None, None)] * (len(raw) - len(stats)))
+    return [(status, old, new, *counts) for (status, old, new), counts in zip(raw, stats)]
+
+
+def _parse_git_log_record(record: str) -> _GitCommit:
+    """Parse one ``_GIT_LOG_FORMAT`` record into a ``_GitCommit``."""
+    fields = record.split("\0", _GIT_LOG_HEADER_FIELDS)
+    sha, parents, an, ae, cn, ce, at, ct, message = fields[:_GIT_LOG_HEADER_FIELDS]
+    diff = fields[_GIT_LOG_HEADER_FIELDS] if len(fields) > _GIT_LOG_HEADER_FIELDS else ""
+    return _GitCommit(
+        sha=sha,
+        parents=parents.split(),
+        author_name=an,
+        author_email=ae,
+        committer_name=cn,
+        committer_email=ce,
+        authored_ts=int(at),
+        committed_ts=int(ct),
+        message=message,
+        changes=_parse_git_log_changes(diff),
+    )
+
+
+def _iter_git_log(
+    repo_root: Path,
+    branch: str,
+    limit: Optional[int] = None,
+    since: Optional[datetime] = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[_GitCommit]:
+    """Stream commits (with per-file changes) from a single ``git log`` process.
+
+    One subprocess returns every commit together with its changed files and
+    line stats, instead of materializing GitPython objects and spawning a
+    tree diff per commit. Merge commits are diffed against their first parent.
+    ``since`` (inclusive, by committer date) and ``limit`` are applied by git,
+    so history outside the window is never read or parsed.
+
+    Raises:
+        ValueError: If git fails (e.g. not a git repository, unknown branch)
+    """
+    cmd = [
+        "git",
+        "log",
+        "-z",
+        "-M",
+        "--raw",
+        "--numstat",
+        "--no-abbrev",
+        "--diff-merges=first-parent",
+        f"--format={_GIT_LOG_FORMAT}",
+    ]
+    if limit is not None:
+        cmd.append(f"--max-count={limit}")
+    if since is not None:
+        since_utc = datetime.fromtimestamp(math.ceil(since.timestamp()), tz=timezone.utc)
+        cmd.append(f"--since={since_utc:%Y-%m-%d %H:%M:%S} +0000")
+    cmd.extend([branch, "--"])
+
+    proc = subprocess.Popen(  # nosec B603 B607 - git with fixed args
+        cmd,
+        cwd=repo_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+    )
+    assert proc.stdout is not None  # nosec B101 - guaranteed by stdout=PIPE
+    buffer = ""
+    try:
+        while chunk := proc.stdout.read(chunk_size):
+            buffer += chunk
+            *records, buffer = buffer.split("\x1e")
+            for record in records:
+                if record:
+                    yield _parse_git_log_record(record)
+        if buffer:
+            yield _parse_git_log_record(buffer)
+    finally:
+        proc.stdout.close()
+        stderr = proc.stderr.read() if proc.stderr else ""
+        if proc.stderr:
+            proc.stderr.close()
+        returncode = proc.wait()
+
+    if returncode != 0:
+        raise ValueError(f"git log failed in {repo_root}: {stderr.strip()}")
+
+
+def _parse_turtle_to_nt(path: str) -> tuple[Optional[str], list[tuple[str, str]], Optional[str]]:
+    """Parse a Turtle file in a worker process.
+
+    Returns:
+        Tuple of (N-Triples data, namespace bindings, error message). The
+        N-Triples form is cheap to ship back and re-parse in the parent.
+    """
+    try:
+        graph = _new_graph()
+        graph.parse(path, format="turtle")
+        namespaces = [(prefix, str(uri)) for prefix, uri in graph.namespaces()]
+        return graph.serialize(format="nt"), namespaces, None
+    except Exception as e:
+        return None, [], str(e)
+
+
+def _total_size(paths: Iterable[Path]) -> int:
+    """Sum file sizes in bytes, skipping files that cannot be stat'ed."""
+    total = 0
+    for path in paths:
+        try:
+            total += path.stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def _count_lines(path: str, chunk_size: int = 1 << 20) -> int:
+    """Count lines in a file by scanning raw bytes for newlines.
+
+    Equivalent to ``len(f.readlines())`` in text mode: ``\\n``, ``\\r\\n`` and a
+    lone ``\\r`` each end a line (universal newlines), and a trailing line
+    without a terminator still counts. Never decodes or materializes lines.
+    """
+    lines = 0
+    last = b""
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(chunk_size):
+            lines += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+            if last.endswith(b"\r") and chunk.startswith(b"\n"):
+                lines -= 1  # \r\n split across chunks
+            last = chunk
+    if last and not last.endswith((b"\n", b"\r")):
+        lines += 1
+    return lines
+
 
 class DigitalTwin:
     """Digital Twin: unified RDF view of repository.
@@ -54,12 +465,16 @@ class DigitalTwin:
         ontologies_graph: TBox (ontologies)
     """
 
-    def __init__(self, workspace_root: Optional[Path] = None):
+    def __init__(self, workspace_root: Optional[Path] = None, parallel_parse: bool = False):
         """Initialize Digital Twin.
 
         Args:
             workspace_root: Path to repository root (default: current directory)
+            parallel_parse: Parse large (>= 4 MiB) Turtle sets in worker processes.
+                Off by default: worker processes need a ``__main__`` guard under
+                the spawn/forkserver start methods and only help on many cores.
         """
+        self.parallel_parse = parallel_parse
         self.workspace_root = workspace_root or Path.cwd()
         if not self.workspace_root.exists():
             raise ValueError(f"Workspace root does not exist: {self.workspace_root}")
@@ -68,9 +483,15 @@ class DigitalTwin:
         if not self.repoq_dir.exists():
             raise ValueError(f".repoq directory not found: {self.repoq_dir}")
 
+        # File URIs shared by commit changes, the file tree and tests
+        self._file_uri_cache: dict[str, URIRef] = {}
+        # Serializes inserts and clears; the generators fill the cache from
+        # get_complete_graph's worker threads while invalidate() may run
+        self._file_uri_lock = threading.Lock()
+
         # Graphs
-        self.static_graph = Graph()
-        self.ontologies_graph = Graph()
+        self.static_graph = _new_graph()
+        self.ontologies_graph = _new_graph()
 
         # Load static data
         self._load_static_data()
@@ -84,6 +505,7 @@ class DigitalTwin:
     def _load_static_data(self) -> None:
         """Load static RDF from .repoq/ (story, adr, changelog)."""
         static_dirs = ["story", "adr", "changelog"]
+        ttl_files: list[Path] = []
 
         for dir_name in static_dirs:
             dir_path = self.repoq_dir / dir_name
@@ -91,13 +513,10 @@ class DigitalTwin:
                 logger.warning(f"Static directory not found: {dir_path}")
                 continue
 
-            # Load all .ttl files in directory
-            for ttl_file in dir_path.rglob("*.ttl"):
-                try:
-                    self.static_graph.parse(ttl_file, format="turtle")
-                    logger.debug(f"Loaded static data: {ttl_file}")
-                except Exception as e:
-                    logger.error(f"Failed to parse {ttl_file}: {e}")
+            # Collect all .ttl files in directory
+            ttl_files.extend(dir_path.rglob("*.ttl"))
+
+        self._parse_turtle_files(self.static_graph, ttl_files, "static data")
 
         logger.info(f"Loaded {len(self.static_graph)} static triples")
 
@@ -109,15 +528,77 @@ class DigitalTwin:
             return
 
         # Load all .ttl files (ontologies)
-        for ttl_file in ontologies_dir.glob("*.ttl"):
-            try:
-                self.ontologies_graph.parse(ttl_file, format="turtle")
-                logger.debug(f"Loaded ontology: {ttl_file}")
-            except Exception as e:
-                logger.error(f"Failed to parse {ttl_file}: {e}")
+        self._parse_turtle_files(
+            self.ontologies_graph, list(ontologies_dir.glob("*.ttl")), "ontology"
+        )
 
         logger.info(f"Loaded {len(self.ontologies_graph)} ontology triples")
 
+    def _file_uri(self, path: str) -> URIRef:
+        """Return the (shared) URIRef for a repository-relative file path.
+
+        The same path is referenced by every commit touching it, by the file
+        tree and by tests; interning the URIRef builds and validates it once
+        and lets all triples alias a single object. Hits are a single atomic
+        dict lookup; misses take the lock so concurrent callers agree on one
+        object per path.
+        """
+        uri = self._file_uri_cache.get(path)
+        if uri is None:
+            with self._file_uri_lock:
+                uri = self._file_uri_cache.get(path)
+                if uri is None:
+                    uri = URIRef(f"https://repoq.dev/resource/file/{_iri_safe(path)}")
+                    self._file_uri_cache[path] = uri
+        return uri
+
+    def invalidate(self) -> None:
+        """Drop cached term objects (e.g. after large repository changes) to bound memory."""
+        with self._file_uri_lock:
+            self._file_uri_cache.clear()
+
+    def _parse_turtle_files(self, graph: Graph, ttl_files: list[Path], kind: str) -> None:
+        """Parse Turtle files into ``graph``, optionally in parallel for large sets.
+
+        rdflib's Turtle parser is pure Python and CPU-bound, so with
+        ``parallel_parse`` large sets are parsed in worker processes
+        (sidestepping the GIL) and merged back as N-Triples, which parse
+        faster than Turtle.
+
+        Args:
+            graph: Target graph
+            ttl_files: Turtle files to load
+            kind: Description used in log messages
+        """
+        workers = min(len(ttl_files), os.cpu_count() or 1)
+        if (
+            not self.parallel_parse
+            or workers < 2
+            or _total_size(ttl_files) < _PARALLEL_PARSE_MIN_BYTES
+        ):
+            for ttl_file in ttl_files:
+                try:
+                    graph.parse(ttl_file, format="turtle")
+                    logger.debug(f"Loaded {kind}: {ttl_file}")
+                except Exception as e:
+                    logger.error(f"Failed to parse {ttl_file}: {e}")
+            return
+
+        chunks = []
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = ex.map(_parse_turtle_to_nt, [str(f) for f in ttl_files])
+            for ttl_file, (nt_data, namespaces, error) in zip(ttl_files, results):
+                if error is not None:
+                    logger.error(f"Failed to parse {ttl_file}: {error}")
+                    continue
+                chunks.append(nt_data)
+                for prefix, uri in namespaces:
+                    graph.bind(prefix, uri, override=False)
+                logger.debug(f"Loaded {kind}: {ttl_file}")
+
+        if chunks:
+            graph.parse(data="".join(chunks), format="nt")
+
     def get_commits_rdf(
         self, branch: str = "HEAD", limit: Optional[int] = None, since: Optional[datetime] = None
     ) -> Graph:
@@ -126,7 +607,7 @@ class DigitalTwin:
         Args:
             branch: Branch name or "HEAD" for current branch
             limit: Max number of commits to fetch (None = all)
-            since: Only commits after this date
+            since: Only commits committed at or after this date (filtered by git)
 
         Returns:
             Graph with repo:Commit, repo:Author, repo:FileChange triples
@@ -134,127 +615,109 @@ class DigitalTwin:
         Raises:
             ValueError: If not a git repository
         """
-        graph = Graph()
+        self._check_git_repository()
+
+        graph = _new_graph()
         graph.bind("repo", REPO)
+        _add_triples(graph, self._commit_triples(branch, limit, since))
 
-        try:
-            repo = git.Repo(self.workspace_root)
-        except git.InvalidGitRepositoryError:
-            raise ValueError(f"Not a git repository: {self.workspace_root}")
+        logger.info(f"Generated {len(graph)} triples from Git commits")
+        return graph
 
-        # Get commits
-        commits_iter = repo.iter_commits(branch, max_count=limit)
+    def _check_git_repository(self) -> None:
+        """Raise ValueError unless the workspace root is a git repository."""
+        if not (self.workspace_root / ".git").exists():
+            raise ValueError(f"Not a git repository: {self.workspace_root}")
 
-        for commit in commits_iter:
-            # Filter by date if specified
-            if since and datetime.fromtimestamp(commit.committed_date) < since:
-                continue
+    def _commit_triples(
+        self, branch: str = "HEAD", limit: Optional[int] = None, since: Optional[datetime] = None
+    ) -> Iterator[Triple]:
+        """Yield commit history triples (see ``get_commits_rdf``)."""
+        # (email, name) pairs already described, so repeated authors are not re-emitted
+        seen_people: set[tuple[str, str]] = set()
 
+        for commit in _iter_git_log(self.workspace_root, branch, limit=limit, since=since):
             # Commit URI
-            commit_uri = URIRef(f"https://repoq.dev/resource/commit/{commit.hexsha}")
+            commit_uri = _commit_uri(commit.sha)
 
             # Commit type
-            graph.add((commit_uri, RDF.type, REPO.Commit))
+            yield (commit_uri, _RDF_TYPE, _REPO_COMMIT)
 
             # SHA
-            graph.add((commit_uri, REPO.sha, Literal(commit.hexsha)))
-            graph.add((commit_uri, REPO.shortSha, Literal(commit.hexsha[:7])))
+            yield (commit_uri, _REPO_SHA, Literal(commit.sha))
+            yield (commit_uri, _REPO_SHORT_SHA, Literal(commit.sha[:7]))
 
             # Message
-            message_lines = commit.message.strip().split("\n", 1)
+            message = commit.message.strip()
+            message_lines = message.split("\n", 1)
             subject = message_lines[0]
             body = message_lines[1].strip() if len(message_lines) > 1 else ""
 
-            graph.add((commit_uri, REPO.message, Literal(commit.message.strip())))
-            graph.add((commit_uri, REPO.subject, Literal(subject)))
+            yield (commit_uri, _REPO_MESSAGE, Literal(message))
+            yield (commit_uri, _REPO_SUBJECT, Literal(subject))
             if body:
-                graph.add((commit_uri, REPO.body, Literal(body)))
+                yield (commit_uri, _REPO_BODY, Literal(body))
 
             # Dates
-            authored_date = datetime.fromtimestamp(commit.authored_date)
-            committed_date = datetime.fromtimestamp(commit.committed_date)
-            graph.add(
-                (commit_uri, REPO.authoredDate, Literal(authored_date, datatype=XSD.dateTime))
-            )
-            graph.add(
-                (commit_uri, REPO.committedDate, Literal(committed_date, datatype=XSD.dateTime))
-            )
-
-            # Author
-            author_uri = URIRef(f"https://repoq.dev/resource/author/{commit.author.email}")
-            graph.add((author_uri, RDF.type, REPO.Author))
-            graph.add((author_uri, REPO.authorName, Literal(commit.author.name)))
-            graph.add((author_uri, REPO.authorEmail, Literal(commit.author.email)))
-            graph.add((commit_uri, REPO.author, author_uri))
+            yield (commit_uri, _REPO_AUTHORED_DATE, _xsd_datetime(commit.authored_ts))
+            yield (commit_uri, _REPO_COMMITTED_DATE, _xsd_datetime(commit.committed_ts))
+
+            # Author (described once per distinct email/name)
+            author_uri = _author_uri(commit.author_email)
+            if (commit.author_email, commit.author_name) not in seen_people:
+                seen_people.add((commit.author_email, commit.author_name))
+                yield (author_uri, _RDF_TYPE, _REPO_AUTHOR)
+                yield (author_uri, _REPO_AUTHOR_NAME, Literal(commit.author_name))
+                yield (author_uri, _REPO_AUTHOR_EMAIL, Literal(commit.author_email))
+            yield (commit_uri, _REPO_AUTHOR_PROP, author_uri)
 
             # Committer (if different from author)
-            if commit.committer.email != commit.author.email:
-                committer_uri = URIRef(
-                    f"https://repoq.dev/resource/author/{commit.committer.email}"
-                )
-                graph.add((committer_uri, RDF.type, REPO.Author))
-                graph.add((committer_uri, REPO.authorName, Literal(commit.committer.name)))
-                graph.add((committer_uri, REPO.authorEmail, Literal(commit.committer.email)))
-                graph.add((commit_uri, REPO.committer, committer_uri))
+            if commit.committer_email != commit.author_email:
+                committer_uri = _author_uri(commit.committer_email)
+                if (commit.committer_email, commit.committer_name) not in seen_people:
+                    seen_people.add((commit.committer_email, commit.committer_name))
+                    yield (committer_uri, _RDF_TYPE, _REPO_AUTHOR)
+                    yield (committer_uri, _REPO_AUTHOR_NAME, Literal(commit.committer_name))
+                    yield (committer_uri, _REPO_AUTHOR_EMAIL, Literal(commit.committer_email))
+                yield (commit_uri, _REPO_COMMITTER, committer_uri)
 
             # Parents
-            for parent in commit.parents:
-                parent_uri = URIRef(f"https://repoq.dev/resource/commit/{parent.hexsha}")
-                graph.add((commit_uri, REPO.parent, parent_uri))
-
-            # File changes
-            if commit.parents:
-                parent = commit.parents[0]
-                diffs = parent.diff(commit, create_patch=False)
-
-                for diff in diffs:
-                    change_uri = URIRef(
-                        f"https://repoq.dev/resource/change/{commit.hexsha[:7]}_{diff.a_path or diff.b_path}"
-                    )
-
-                    # Determine change type
-                    if diff.new_file:
-                        graph.add((change_uri, RDF.type, REPO.Addition))
-                    elif diff.deleted_file:
-                        graph.add((change_uri, RDF.type, REPO.Deletion))
-                    elif diff.renamed_file:
-                        graph.add((change_uri, RDF.type, REPO.Rename))
-                    else:
-                        graph.add((change_uri, RDF.type, REPO.Modification))
-
-                    # Link to commit
-                    graph.add((commit_uri, REPO.hasChange, change_uri))
-
-                    # File path
-                    file_path = diff.b_path or diff.a_path
-                    file_uri = URIRef(f"https://repoq.dev/resource/file/{file_path}")
-                    graph.add((change_uri, REPO.changesFile, file_uri))
-
-                    # Stats (if available)
-                    if hasattr(diff, "diff") and diff.diff:
-                        # Count lines (rough approximation)
-                        diff_text = (
-                            diff.diff.decode("utf-8", errors="ignore")
-                            if isinstance(diff.diff, bytes)
-                            else str(diff.diff)
-                        )
-                        added = diff_text.count("\n+")
-                        removed = diff_text.count("\n-")
-                        if added > 0:
-                            graph.add(
-                                (change_uri, REPO.linesAdded, Literal(added, datatype=XSD.integer))
-                            )
-                        if removed > 0:
-                            graph.add(
-                                (
-                                    change_uri,
-                                    REPO.linesRemoved,
-                                    Literal(removed, datatype=XSD.integer),
-                                )
-                            )
+            for parent_sha in commit.parents:
+                parent_uri = _commit_uri(parent_sha)
+                yield (commit_uri, _REPO_PARENT, parent_uri)
 
-        logger.info(f"Generated {len(graph)} triples from Git commits")
-        return graph
+            # File changes (against the first parent; root commits have none)
+            if not commit.parents:
+                continue
+
+            for status, old_path, new_path, added, removed in commit.changes:
+                change_uri = URIRef(
+                    "https://repoq.dev/resource/change/"
+                    f"{commit.sha[:7]}_{_iri_safe(old_path or new_path)}"
+                )
+
+                # Determine change type
+                if status == "A":
+                    yield (change_uri, _RDF_TYPE, _REPO_ADDITION)
+                elif status == "D":
+                    yield (change_uri, _RDF_TYPE, _REPO_DELETION)
+                elif status == "R":
+                    yield (change_uri, _RDF_TYPE, _REPO_RENAME)
+                else:
+                    yield (change_uri, _RDF_TYPE, _REPO_MODIFICATION)
+
+                # Link to commit
+                yield (commit_uri, _REPO_HAS_CHANGE, change_uri)
+
+                # File path
+                file_uri = self._file_uri(new_path or old_path)
+                yield (change_uri, _REPO_CHANGES_FILE, file_uri)
+
+                # Line stats (absent for binary files)
+                if added:
+                    yield (change_uri, _REPO_LINES_ADDED, Literal(added, datatype=_XSD_INTEGER))
+                if removed:
+                    yield (change_uri, _REPO_LINES_REMOVED, Literal(removed, datatype=_XSD_INTEGER))
 
     def get_files_rdf(
         self, extensions: Optional[list[str]] = None, exclude_patterns: Optional[list[str]] = None
@@ -263,14 +726,23 @@ class DigitalTwin:
 
         Args:
             extensions: Include only these extensions (e.g., [".py", ".ttl"])
-            exclude_patterns: Exclude paths matching these patterns (e.g., ["__pycache__"])
+            exclude_patterns: Exclude paths with a component matching these glob patterns
+                (e.g., ["__pycache__", "*.egg-info"]); excluded directories are not descended
 
         Returns:
             Graph with repo:File triples (path, size, LOC)
         """
-        graph = Graph()
+        graph = _new_graph()
         graph.bind("repo", REPO)
+        _add_triples(graph, self._file_triples(extensions, exclude_patterns))
 
+        logger.info(f"Generated {len(graph)} triples from file tree")
+        return graph
+
+    def _file_triples(
+        self, extensions: Optional[list[str]] = None, exclude_patterns: Optional[list[str]] = None
+    ) -> Iterator[Triple]:
+        """Yield file tree triples (see ``get_files_rdf``)."""
         # Default exclusions
         if exclude_patterns is None:
             exclude_patterns = [
@@ -288,61 +760,49 @@ class DigitalTwin:
                 "dist",
             ]
 
-        def should_exclude(path: Path) -> bool:
-            """Check if path matches exclusion patterns."""
-            for pattern in exclude_patterns:
-                if pattern.startswith("*"):
-                    # Extension pattern (e.g., "*.egg-info")
-                    if path.name.endswith(pattern[1:]):
-                        return True
-                else:
-                    # Name pattern (e.g., "__pycache__")
-                    if pattern in path.parts:
-                        return True
-            return False
+        # Compile all patterns (exact names like "__pycache__" or globs like
+        # "*.egg-info") into one regex matched against each path component
+        exclude_re = _compile_name_patterns(exclude_patterns)
 
-        # Iterate files
-        for file_path in self.workspace_root.rglob("*"):
-            # Skip directories
-            if not file_path.is_file():
-                continue
+        def should_exclude(name: str) -> bool:
+            """Check if a path component matches exclusion patterns."""
+            return exclude_re is not None and exclude_re.match(name) is not None
 
-            # Skip excluded paths
-            if should_exclude(file_path):
-                continue
+        # Iterate files
+        for relative_path, entry in _walk_files(str(self.workspace_root), should_exclude):
+            suffix = os.path.splitext(entry.name)[1]
 
             # Filter by extension if specified
-            if extensions and file_path.suffix not in extensions:
+            if extensions and suffix not in extensions:
                 continue
 
             # File URI
-            relative_path = file_path.relative_to(self.workspace_root)
-            file_uri = URIRef(f"https://repoq.dev/resource/file/{relative_path}")
+            file_uri = self._file_uri(relative_path)
 
             # Determine file type
-            if file_path.suffix == ".py":
-                graph.add((file_uri, RDF.type, REPO.PythonFile))
-            elif file_path.suffix == ".ttl":
-                graph.add((file_uri, RDF.type, REPO.TTLFile))
-            elif file_path.suffix == ".md":
-                graph.add((file_uri, RDF.type, REPO.MarkdownFile))
+            if suffix == ".py":
+                yield (file_uri, _RDF_TYPE, _REPO_PYTHON_FILE)
+            elif suffix == ".ttl":
+                yield (file_uri, _RDF_TYPE, _REPO_TTL_FILE)
+            elif suffix == ".md":
+                yield (file_uri, _RDF_TYPE, _REPO_MARKDOWN_FILE)
             else:
-                graph.add((file_uri, RDF.type, REPO.File))
+                yield (file_uri, _RDF_TYPE, _REPO_FILE)
 
             # Path properties
-            graph.add((file_uri, REPO.filePath, Literal(str(relative_path))))
-            graph.add((file_uri, REPO.fileName, Literal(file_path.name)))
-            graph.add((file_uri, REPO.fileExtension, Literal(file_path.suffix)))
+            yield (file_uri, _REPO_FILE_PATH, Literal(relative_path))
+            yield (file_uri, _REPO_FILE_NAME, Literal(entry.name))
+            yield (file_uri, _REPO_FILE_EXTENSION, Literal(suffix))
 
             # Size
             try:
-                size = file_path.stat().st_size
-                graph.add((file_uri, REPO.fileSize, Literal(size, datatype=XSD.integer)))
-            except Exception as e:
-                logger.warning(f"Could not get size for {file_path}: {e}")
+                size = entry.stat().st_size
+                yield (file_uri, _REPO_FILE_SIZE, Literal(size, datatype=_XSD_INTEGER))
+            except OSError as e:
+                logger.warning(f"Could not get size for {entry.path}: {e}")
 
             # Lines of code (for text files)
-            if file_path.suffix in [
+            if suffix in [
                 ".py",
                 ".ttl",
                 ".md",
@@ -353,14 +813,10 @@ class DigitalTwin:
                 ".toml",
             ]:
                 try:
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        lines = len(f.readlines())
-                    graph.add((file_uri, REPO.linesOfCode, Literal(lines, datatype=XSD.integer)))
+                    lines = _count_lines(entry.path)
+                    yield (file_uri, _REPO_LINES_OF_CODE, Literal(lines, datatype=_XSD_INTEGER))
                 except Exception as e:
-                    logger.warning(f"Could not count lines for {file_path}: {e}")
-
-        logger.info(f"Generated {len(graph)} triples from file tree")
-        return graph
+                    logger.warning(f"Could not count lines for {entry.path}: {e}")
 
     def get_tests_rdf(self) -> Graph:
         """Generate RDF from test suite (pytest collection).
@@ -370,21 +826,20 @@ class DigitalTwin:
         Returns:
             Graph with repo:Test, repo:TestSuite triples
         """
-        graph = Graph()
+        graph = _new_graph()
         graph.bind("repo", REPO)
+        _add_triples(graph, self._test_triples())
 
+        logger.info(f"Generated {len(graph)} triples from test suite")
+        return graph
+
+    def _test_triples(self) -> Iterator[Triple]:
+        """Yield test suite triples (see ``get_tests_rdf``)."""
         # Check if tests directory exists
         tests_dir = self.workspace_root / "tests"
         if not tests_dir.exists():
             logger.info("No tests directory found, skipping test collection")
-            return graph
-
-        try:
-            import subprocess
-            import sys
-        except ImportError:
-            logger.warning("subprocess not available")
-            return graph
+            return
 
         # Run pytest --collect-only to get test list
         try:
@@ -397,14 +852,14 @@ class DigitalTwin:
             )
         except Exception as e:
             logger.error(f"pytest collection failed: {e}")
-            return graph
+            return
 
         # Parse output
         lines = result.stdout.splitlines()
 
         # Create TestSuite
         suite_uri = URIRef("https://repoq.dev/resource/testsuite/main")
-        graph.add((suite_uri, RDF.type, REPO.TestSuite))
+        yield (suite_uri, _RDF_TYPE, _REPO_TEST_SUITE)
 
         # Count tests
         test_count = 0
@@ -429,7 +884,7 @@ class DigitalTwin:
             test_count += 1
 
             # Test URI
-            test_uri = URIRef(f"https://repoq.dev/resource/test/{node_id}")
+            test_uri = URIRef(f"https://repoq.dev/resource/test/{_iri_safe(node_id)}")
 
             # Determine test type
             parts = node_id.split("::")
@@ -437,56 +892,54 @@ class DigitalTwin:
                 class_or_func = parts[1]
                 if class_or_func[0].isupper():
                     # Test class
-                    graph.add((test_uri, RDF.type, REPO.TestClass))
+                    yield (test_uri, _RDF_TYPE, _REPO_TEST_CLASS)
                     test_class_count += 1
                 else:
                     # Test function
-                    graph.add((test_uri, RDF.type, REPO.TestFunction))
+                    yield (test_uri, _RDF_TYPE, _REPO_TEST_FUNCTION)
                     test_function_count += 1
             else:
                 # Top-level test function
-                graph.add((test_uri, RDF.type, REPO.TestFunction))
+                yield (test_uri, _RDF_TYPE, _REPO_TEST_FUNCTION)
                 test_function_count += 1
 
             # Test name (last part)
             test_name = parts[-1] if "::" in node_id else node_id
-            graph.add((test_uri, REPO.testName, Literal(test_name)))
+            yield (test_uri, _REPO_TEST_NAME, Literal(test_name))
 
             # Node ID
-            graph.add((test_uri, REPO.testNodeId, Literal(node_id)))
+            yield (test_uri, _REPO_TEST_NODE_ID, Literal(node_id))
 
             # Test file
             file_path_str = parts[0] if "::" in node_id else node_id
             try:
-                file_uri = URIRef(f"https://repoq.dev/resource/file/{file_path_str}")
-                graph.add((test_uri, REPO.testFile, file_uri))
+                file_uri = self._file_uri(file_path_str)
+                yield (test_uri, _REPO_TEST_FILE, file_uri)
             except Exception as e:
                 logger.warning(f"Could not determine test file for {node_id}: {e}")
 
             # Link to suite
-            graph.add((suite_uri, REPO.hasTest, test_uri))
+            yield (suite_uri, _REPO_HAS_TEST, test_uri)
 
         # Suite statistics
         if test_count > 0:
-            graph.add((suite_uri, REPO.testCount, Literal(test_count, datatype=XSD.integer)))
-            graph.add(
-                (suite_uri, REPO.testClassCount, Literal(test_class_count, datatype=XSD.integer))
+            yield (suite_uri, _REPO_TEST_COUNT, Literal(test_count, datatype=_XSD_INTEGER))
+            yield (
+                suite_uri,
+                _REPO_TEST_CLASS_COUNT,
+                Literal(test_class_count, datatype=_XSD_INTEGER),
             )
-            graph.add(
-                (
-                    suite_uri,
-                    REPO.testFunctionCount,
-                    Literal(test_function_count, datatype=XSD.integer),
-                )
+            yield (
+                suite_uri,
+                _REPO_TEST_FUNCTION_COUNT,
+                Literal(test_function_count, datatype=_XSD_INTEGER),
             )
 
             logger.info(
-                f"Generated {len(graph)} triples from {test_count} tests "
+                f"Collected {test_count} tests "
                 f"({test_class_count} classes, {test_function_count} functions)"
             )
 
-        return graph
-
     def get_complete_graph(self, include_ontologies: bool = False) -> Graph:
         """Merge static + dynamic RDF into complete graph.
 
@@ -496,15 +949,23 @@ class DigitalTwin:
         Returns:
             Complete graph with all triples
         """
-        complete = Graph()
+        complete = _new_graph()
 
         # Add static data
         complete += self.static_graph
 
-        # Add dynamic data
-        complete += self.get_commits_rdf()
-        complete += self.get_files_rdf()
-        complete += self.get_tests_rdf()
+        # Add dynamic data. The generators are dominated by I/O waits (git,
+        # filesystem, pytest subprocess), so run them concurrently and merge in
+        # a fixed order. Their only shared state is the file URI cache, which
+        # _file_uri() and invalidate() guard with a lock.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.get_commits_rdf),
+                executor.submit(self.get_files_rdf),
+                executor.submit(self.get_tests_rdf),
+            ]
+            for future in futures:
+                complete += future.result()
 
         # Optionally add ontologies
         if include_ontologies:
@@ -521,11 +982,30 @@ class DigitalTwin:
         Args:
             output_path: Path to save file
             include_ontologies: Include TBox in export
-            format: RDF serialization format (turtle, xml, json-ld)
+            format: RDF serialization format (turtle, xml, json-ld, nt). N-Triples
+                is streamed directly to disk without building the merged graph.
         """
-        graph = self.get_complete_graph(include_ontologies=include_ontologies)
-
         output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if format in _NTRIPLES_FORMATS:
+            # Stream straight from the generators: no merged in-memory graph
+            self._check_git_repository()
+            sources: list[Iterable[tuple[Node, Node, Node]]] = [
+                self.static_graph,
+                self._commit_triples(),
+                self._file_triples(),
+                self._test_triples(),
+            ]
+            if include_ontologies:
+                sources.append(self.ontologies_graph)
+
+            with output_path.open("w", encoding="utf-8") as f:
+                count = _write_ntriples(f, itertools.chain.from_iterable(sources))
+
+            logger.info(f"Exported {count} triples to {output_path} ({format})")
+            return
+
+        graph = self.get_complete_graph(include_ontologies=include_ontologies)
         graph.serialize(destination=output_path, format=format)
 
         logger.info(f"Exported {len(graph)} triples to {output_path} ({format})")
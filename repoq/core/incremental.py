@@ -21,7 +21,7 @@ Architecture:
         get_changed_files(base_ref, head_ref) → List[str]
 
     IncrementalAnalyzer:
-        filter_unchanged_files(files: Dict[str, bytes]) → Dict[str, bytes]
+        filter_unchanged_files(files: Dict[str, bytes | memoryview]) → Dict[str, ...]
         get_cached_metrics(content) → CachedMetrics | None
         store_metrics(path, content, metrics) → None
 
@@ -51,10 +51,24 @@ from typing import Any, Dict, List, Optional
 from .. import __version__
 from .metric_cache import CachedMetrics, MetricCache
 
+try:
+    import pygit2
+except ImportError:  # pragma: no cover - optional dependency
+    pygit2 = None
+
 logger = logging.getLogger(__name__)
 
 
-def compute_cache_key(file_content: bytes, policy_version: str) -> str:
+def _sha256_hex(file_content: bytes | memoryview) -> str:
+    """SHA256 hex digest of file content.
+
+    ``hashlib`` reads any buffer-protocol object in place, so callers may pass
+    ``bytes`` or a ``memoryview`` (e.g. over an mmap) without copying.
+    """
+    return hashlib.sha256(file_content).hexdigest()
+
+
+def compute_cache_key(file_content: bytes | memoryview, policy_version: str) -> str:
     """Compute cache key from file content SHA, policy version, and repoq version.
 
     Cache key format: {file_sha}_{policy_version}_{repoq_version}
@@ -72,12 +86,14 @@ def compute_cache_key(file_content: bytes, policy_version: str) -> str:
         >>> compute_cache_key(content, "v1.0")
         'a1b2c3...full_sha..._v1.0_2.0.0'
     """
-    file_sha = hashlib.sha256(file_content).hexdigest()  # FULL SHA, not [:16]
+    file_sha = _sha256_hex(file_content)  # FULL SHA, not [:16]
     repoq_version = __version__
     return f"{file_sha}_{policy_version}_{repoq_version}"
 
 
-def needs_analysis(file_content: bytes, policy_version: str, cache: MetricCache) -> bool:
+def needs_analysis(
+    file_content: bytes | memoryview, policy_version: str, cache: MetricCache
+) -> bool:
     """Determine if file needs analysis based on cache.
 
     Returns True if:
@@ -101,8 +117,10 @@ def needs_analysis(file_content: bytes, policy_version: str, cache: MetricCache)
         >>> needs_analysis(b"def foo(): pass", "v1.0", cache)
         False  # Cache hit
     """
-    file_sha = hashlib.sha256(file_content).hexdigest()
-    return cache.get(file_sha, policy_version) is None
+    # Cold cache for this policy: every lookup misses, so skip hashing
+    if not cache.has_entries(policy_version):
+        return True
+    return cache.get(_sha256_hex(file_content), policy_version) is None
 
 
 class DiffAnalyzer:
@@ -145,10 +163,61 @@ class DiffAnalyzer:
         Raises:
             subprocess.CalledProcessError: If git command fails
 
+        Note:
+            Uses libgit2 (pygit2) in-process when installed, avoiding two
+            git fork/execs per call; falls back to the git CLI otherwise or
+            when libgit2 cannot resolve the refs.
+
         Example:
             >>> analyzer.get_changed_files("HEAD~1", "HEAD")
             ['src/modified.py', 'tests/test_new.py']
         """
+        changed_files = None
+        if pygit2 is not None:
+            try:
+                changed_files = self._changed_files_libgit2(base_ref, head_ref)
+            except (pygit2.GitError, KeyError, ValueError) as e:
+                # Fall back to the git CLI, which reports errors consistently
+                logger.debug(f"libgit2 diff failed ({e}), falling back to git CLI")
+
+        if changed_files is None:
+            changed_files = self._changed_files_cli(base_ref, head_ref)
+
+        logger.info(
+            f"Detected {len(changed_files)} changed files between {base_ref} and {head_ref}"
+        )
+        return changed_files
+
+    def _changed_files_libgit2(self, base_ref: str, head_ref: str) -> List[str]:
+        """Compute changed files in-process with libgit2 (no git subprocesses).
+
+        Mirrors ``git diff --name-only`` (with rename detection) and, for the
+        working directory, ``git ls-files --others --exclude-standard``.
+        """
+        repo = pygit2.Repository(str(self.repo_path))
+        base_tree = repo.revparse_single(base_ref).peel(pygit2.Tree)
+
+        if head_ref == ".":
+            # Like `git diff <base>`: tree -> index merged with index -> workdir,
+            # so files tracked only in the index are not mistaken for untracked
+            diff = base_tree.diff_to_index(repo.index)
+            diff.merge(repo.index.diff_to_workdir())
+        else:
+            head_tree = repo.revparse_single(head_ref).peel(pygit2.Tree)
+            diff = base_tree.diff_to_tree(head_tree)
+        diff.find_similar()
+        changed = [delta.new_file.path for delta in diff.deltas]
+
+        if head_ref == ".":
+            untracked = sorted(
+                path for path, flags in repo.status().items() if flags & pygit2.GIT_STATUS_WT_NEW
+            )
+            changed.extend(untracked)
+
+        return changed
+
+    def _changed_files_cli(self, base_ref: str, head_ref: str) -> List[str]:
+        """Compute changed files by running the git CLI."""
         # Handle working directory (".")
         if head_ref == ".":
             # git diff --name-only HEAD (shows modified/deleted files)
@@ -174,10 +243,9 @@ class DiffAnalyzer:
             untracked = [f for f in result_untracked.stdout.strip().split("\n") if f]
 
             return changed + untracked
-        else:
-            # git diff --name-only base_ref..head_ref
-            cmd = ["git", "diff", "--name-only", f"{base_ref}..{head_ref}"]
 
+        # git diff --name-only base_ref..head_ref
+        cmd = ["git", "diff", "--name-only", f"{base_ref}..{head_ref}"]
         result = subprocess.run(  # nosec B603 B607
             cmd,
             cwd=self.repo_path,
@@ -187,12 +255,7 @@ class DiffAnalyzer:
         )
 
         # Parse output (one file per line)
-        changed_files = [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
-
-        logger.info(
-            f"Detected {len(changed_files)} changed files between {base_ref} and {head_ref}"
-        )
-        return changed_files
+        return [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
 
 
 class IncrementalAnalyzer:
@@ -230,7 +293,9 @@ class IncrementalAnalyzer:
         self.cache = cache
         self.policy_version = policy_version
 
-    def filter_unchanged_files(self, files: Dict[str, bytes]) -> Dict[str, bytes]:
+    def filter_unchanged_files(
+        self, files: Dict[str, bytes | memoryview]
+    ) -> Dict[str, bytes | memoryview]:
         """Filter out unchanged files (cache hits).
 
         Args:
@@ -244,11 +309,37 @@ class IncrementalAnalyzer:
             >>> to_analyze = analyzer.filter_unchanged_files(files)
             >>> # Only returns files not in cache
         """
-        to_analyze = {}
+        return {path: files[path] for path in self.filter_unchanged_digests(files)}
+
+    def filter_unchanged_digests(self, files: Dict[str, bytes | memoryview]) -> Dict[str, str]:
+        """Filter out unchanged files, returning the digest of each cache miss.
+
+        Callers that go on to store metrics can pass the digest back to
+        ``store_metrics`` so each file is hashed only once.
+
+        Args:
+            files: Dict of {file_path: file_content}
+
+        Returns:
+            Dict of {file_path: sha256 hex} for files that need analysis.
+            Digests are empty strings when the cache is cold and nothing was hashed.
+
+        Example:
+            >>> digests = analyzer.filter_unchanged_digests(files)
+            >>> for path, sha in digests.items():
+            ...     analyzer.store_metrics(path, files[path], analyze(path), file_sha=sha)
+        """
+        # Cold cache for this policy: nothing can hit, so skip hashing every file
+        if not self.cache.has_entries(self.policy_version):
+            logger.info(f"Cache: no entries for policy {self.policy_version}, analyzing all files")
+            return dict.fromkeys(files, "")
+
+        to_analyze: Dict[str, str] = {}
 
         for file_path, file_content in files.items():
-            if needs_analysis(file_content, self.policy_version, self.cache):
-                to_analyze[file_path] = file_content
+            file_sha = _sha256_hex(file_content)
+            if self.cache.get(file_sha, self.policy_version) is None:
+                to_analyze[file_path] = file_sha
                 logger.debug(f"Cache miss: {file_path} needs analysis")
             else:
                 logger.debug(f"Cache hit: {file_path} skipped")
@@ -263,7 +354,7 @@ class IncrementalAnalyzer:
 
         return to_analyze
 
-    def get_cached_metrics(self, file_content: bytes) -> Optional[CachedMetrics]:
+    def get_cached_metrics(self, file_content: bytes | memoryview) -> Optional[CachedMetrics]:
         """Retrieve cached metrics for file.
 
         Args:
@@ -277,16 +368,23 @@ class IncrementalAnalyzer:
             >>> if cached:
             ...     print(cached.metrics["complexity"])
         """
-        file_sha = hashlib.sha256(file_content).hexdigest()
-        return self.cache.get(file_sha, self.policy_version)
-
-    def store_metrics(self, file_path: str, file_content: bytes, metrics: Dict[str, Any]) -> None:
+        return self.cache.get(_sha256_hex(file_content), self.policy_version)
+
+    def store_metrics(
+        self,
+        file_path: str,
+        file_content: bytes | memoryview,
+        metrics: Dict[str, Any],
+        file_sha: Optional[str] = None,
+    ) -> None:
         """Store metrics in cache.
 
         Args:
             file_path: Path to file (relative to repo root)
             file_content: File content as bytes
             metrics: Dict of metric name → value
+            file_sha: SHA-256 of file_content from ``filter_unchanged_digests``;
+                computed here when omitted or empty
 
         Example:
             >>> analyzer.store_metrics(
@@ -295,7 +393,8 @@ class IncrementalAnalyzer:
             ...     {"complexity": 1, "lines": 10}
             ... )
         """
-        file_sha = hashlib.sha256(file_content).hexdigest()
+        if not file_sha:
+            file_sha = _sha256_hex(file_content)
         timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
         self.cache.set(
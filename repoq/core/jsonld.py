@@ -7,17 +7,71 @@ including PROV-O, OSLC, SPDX, FOAF, and Schema.org.
 
 from __future__ import annotations
 
+import copy
+import itertools
 import json
 import logging
 import os
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional
+
+from .model import (
+    Commit,
+    CouplingEdge,
+    DependencyEdge,
+    File,
+    Issue,
+    Module,
+    Person,
+    Project,
+    TestResult,
+    VersionResource,
+)
+
+try:
+    import orjson
 
-from .model import Project
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson ships with the 'full' extra
+    orjson = None
+    _HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
 
+def _read_small_file(path: str) -> bytes:
+    """Read a whole file with raw descriptor calls.
+
+    Context files are small, so one fstat-sized os.read usually suffices and
+    skips the buffered-reader layer of open().
+
+    Args:
+        path: File to read
+
+    Returns:
+        File contents
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 1 << 16))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
 def _load_context(path: Optional[str]) -> Optional[Dict[str, Any]]:
     """Load JSON-LD context from a file.
 
@@ -35,13 +89,8 @@ def _load_context(path: Optional[str]) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        context_path = Path(path)
-        if not context_path.exists():
-            logger.warning(f"Context file not found: {path}")
-            return None
-
-        with context_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = _read_small_file(path)
+        data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
 
         if not isinstance(data, dict):
             logger.warning(f"Invalid context file format (not a dict): {path}")
@@ -49,7 +98,10 @@ def _load_context(path: Optional[str]) -> Optional[Dict[str, Any]]:
 
         return data
 
-    except json.JSONDecodeError as e:
+    except FileNotFoundError:
+        logger.warning(f"Context file not found: {path}")
+        return None
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
         logger.error(f"Failed to parse JSON context file {path}: {e}")
         return None
     except OSError as e:
@@ -64,6 +116,53 @@ DEFAULT_CONTEXT_PATH = os.path.join(
     os.path.dirname(__file__), "..", "ontologies", "context_ext.jsonld"
 )
 
+# Shared @type values; serializers emit tuples as JSON arrays
+_PROJECT_TYPES = (
+    "repo:Project",
+    "schema:SoftwareSourceCode",
+    "codemeta:SoftwareSourceCode",
+    "prov:Entity",
+    "okn_sd:Software",
+)
+_FILE_TYPES = ("repo:File", "schema:SoftwareSourceCode", "spdx:File", "prov:Entity")
+_PERSON_TYPES = ("schema:Person", "foaf:Person", "prov:Agent", "prov:Person")
+_COMMIT_TYPES = ("prov:Activity", "repo:Commit")
+_VERSION_TYPES = ("oslc_config:VersionResource",)
+_TEST_RESULT_TYPES = ("oslc_qm:TestResult",)
+
+
+@lru_cache(maxsize=32)
+def _load_context_version(path: str, mtime_ns: int, size: int) -> Optional[Mapping[str, Any]]:
+    """Parse one on-disk version of a context file.
+
+    Args:
+        path: Path to the JSON-LD context file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: File size in bytes, part of the cache key
+
+    Returns:
+        Read-only view of the parsed context, or None if it cannot be loaded
+    """
+    data = _load_context(path)
+    return MappingProxyType(data) if data is not None else None
+
+
+def _cached_context(path: str) -> Optional[Mapping[str, Any]]:
+    """Load a JSON-LD context, reusing the parse while the file is unchanged.
+
+    Args:
+        path: Path to the JSON-LD context file
+
+    Returns:
+        Read-only view of the parsed context, or None if it cannot be loaded.
+        Callers must copy before merging.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return _load_context(path)  # logs why and returns None
+    return _load_context_version(path, st.st_mtime_ns, st.st_size)
+
 
 def _merge_contexts(
     base_context: Dict[str, Any],
@@ -80,19 +179,82 @@ def _merge_contexts(
     Returns:
         Merged context dictionary
     """
-    if context_file:
-        ctx_user = _load_context(context_file)
-        if isinstance(ctx_user, dict) and "@context" in ctx_user:
-            base_context["@context"].update(ctx_user["@context"])
-
-    if field33_context:
-        ctx_f33 = _load_context(field33_context)
-        if isinstance(ctx_f33, dict) and "@context" in ctx_f33:
-            base_context["@context"].update(ctx_f33["@context"])
+    extensions = [
+        ctx["@context"]
+        for ctx in map(_cached_context, filter(None, (context_file, field33_context)))
+        if ctx is not None and isinstance(ctx.get("@context"), dict)
+    ]
+    if extensions:
+        # One update pass; later files still override earlier ones
+        base_context["@context"].update(
+            itertools.chain.from_iterable(ext.items() for ext in extensions)
+        )
 
     return base_context
 
 
+def _merged_context(context_file: Optional[str], field33_context: Optional[str]) -> Dict[str, Any]:
+    """Merge the default @context with the optional custom ones.
+
+    Args:
+        context_file: Optional path to custom context file
+        field33_context: Optional path to Field33-specific context
+
+    Returns:
+        New merged @context mapping owned by the caller
+    """
+    # Shallow-copy so _merge_contexts can update it without touching the cache
+    default = _cached_context(DEFAULT_CONTEXT_PATH) or {}
+    ctx_base = {"@context": dict(default.get("@context") or {})}
+    return _merge_contexts(ctx_base, context_file, field33_context)["@context"]
+
+
+@lru_cache(maxsize=16)
+def _merged_context_version(
+    context_file: Optional[str],
+    field33_context: Optional[str],
+    fingerprint: tuple[tuple[int, int], ...],
+) -> MappingProxyType[str, Any]:
+    """Merge one combination of on-disk context file versions.
+
+    Args:
+        context_file: Optional path to custom context file
+        field33_context: Optional path to Field33-specific context
+        fingerprint: (mtime_ns, size) of every context file involved, part of
+            the cache key
+
+    Returns:
+        Read-only view of the merged @context
+    """
+    return MappingProxyType(_merged_context(context_file, field33_context))
+
+
+def _cached_merged_context(
+    context_file: Optional[str], field33_context: Optional[str]
+) -> Dict[str, Any]:
+    """Merged @context, re-merged only when one of the context files changes.
+
+    Args:
+        context_file: Optional path to custom context file
+        field33_context: Optional path to Field33-specific context
+
+    Returns:
+        New merged @context mapping owned by the caller
+    """
+    fingerprint = []
+    for path in (DEFAULT_CONTEXT_PATH, context_file, field33_context):
+        if path:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return _merged_context(context_file, field33_context)  # loaders log why
+            fingerprint.append((st.st_mtime_ns, st.st_size))
+    # Deep copy: term definitions are nested dicts that must not alias the cache
+    return copy.deepcopy(
+        dict(_merged_context_version(context_file, field33_context, tuple(fingerprint)))
+    )
+
+
 def _build_project_metadata(project: Project, context: Dict[str, Any]) -> Dict[str, Any]:
     """Build base JSON-LD metadata for project.
 
@@ -101,18 +263,13 @@ def _build_project_metadata(project: Project, context: Dict[str, Any]) -> Dict[s
         context: Merged JSON-LD context
 
     Returns:
-        Dict with @context, @id, @type, and project metadata
+        Dict with @context, @id, @type, and project metadata (entity lists are
+        added by to_jsonld)
     """
     return {
         "@context": context["@context"],
         "@id": project.id,
-        "@type": [
-            "repo:Project",
-            "schema:SoftwareSourceCode",
-            "codemeta:SoftwareSourceCode",
-            "prov:Entity",
-            "okn_sd:Software",
-        ],
+        "@type": _PROJECT_TYPES,
         "name": project.name,
         "description": project.description,
         "programmingLanguages": list(project.programming_languages.keys()),
@@ -125,19 +282,10 @@ def _build_project_metadata(project: Project, context: Dict[str, Any]) -> Dict[s
         # Quality metrics
         "qualityScore": getattr(project, "qualityScore", None),
         "qualityGrade": getattr(project, "qualityGrade", None),
-        "modules": [],
-        "files": [],
-        "contributors": [],
-        "issues": [],
-        "dependencies": [],
-        "coupling": [],
-        "commits": [],
-        "config": [],
-        "tests": [],
     }
 
 
-def _serialize_module(module) -> Dict[str, Any]:
+def _serialize_module(module: Module) -> Dict[str, Any]:
     """Serialize Module entity to JSON-LD.
 
     Args:
@@ -162,35 +310,45 @@ def _serialize_module(module) -> Dict[str, Any]:
     }
 
 
-def _serialize_file(file) -> Dict[str, Any]:
+def _serialize_file(file: File) -> Dict[str, Any]:
     """Serialize File entity to JSON-LD.
 
     Args:
         file: File model object
 
     Returns:
-        Dict with file properties
+        Dict with file properties; optional metrics that are None are omitted
     """
     file_node = {
         "@id": file.id,
-        "@type": ["repo:File", "schema:SoftwareSourceCode", "spdx:File", "prov:Entity"],
+        "@type": _FILE_TYPES,
         "path": file.path,
         "fileName": file.path,
-        "language": file.language,
         "linesOfCode": file.lines_of_code,
-        "complexity": file.complexity,
-        "maintainability": file.maintainability,
         "commitsCount": file.commits_count,
         "codeChurn": file.code_churn,
+        # Metrics carry linesAdded and optionally linesDeleted depending on the
+        # history backend; a single-literal spread beats per-key copies here.
         "contributors": [{"@id": pid, **metrics} for pid, metrics in file.contributors.items()],
         "issues": file.issues,
-        "lastModified": file.last_modified,
         "deprecated": file.deprecated,
         "testFile": file.test_file,
-        "module": file.module,
-        "hotness": file.hotness,
     }
 
+    # Unset optional metrics are omitted; JSON-LD would drop the nulls anyway
+    if file.language is not None:
+        file_node["language"] = file.language
+    if file.complexity is not None:
+        file_node["complexity"] = file.complexity
+    if file.maintainability is not None:
+        file_node["maintainability"] = file.maintainability
+    if file.last_modified is not None:
+        file_node["lastModified"] = file.last_modified
+    if file.module is not None:
+        file_node["module"] = file.module
+    if file.hotness is not None:
+        file_node["hotness"] = file.hotness
+
     # Include per-function metrics if available
     if file.functions:
         file_node["functions"] = [
@@ -217,30 +375,50 @@ def _serialize_file(file) -> Dict[str, Any]:
     return file_node
 
 
-def _serialize_contributor(contributor) -> Dict[str, Any]:
+def _serialize_contributor(contributor: Person) -> Dict[str, Any]:
     """Serialize Person/Contributor entity to JSON-LD.
 
     Args:
         contributor: Person model object
 
     Returns:
-        Dict with contributor properties
+        Dict with contributor properties; empty email fields are omitted
     """
-    return {
+    node = {
         "@id": contributor.id,
-        "@type": ["schema:Person", "foaf:Person", "prov:Agent", "prov:Person"],
+        "@type": _PERSON_TYPES,
         "name": contributor.name,
-        "email": contributor.email or None,
-        "emailHash": contributor.email_hash or None,
-        "mbox_sha1sum": contributor.foaf_mbox_sha1sum or None,
         "commits": contributor.commits,
         "linesAdded": contributor.lines_added,
         "linesDeleted": contributor.lines_deleted,
         "owns": contributor.owns,
         "modulesContributed": contributor.modules_contributed,
     }
-
-
+    # Anonymized or incomplete identities leave these empty; omit them
+    if contributor.email:
+        node["email"] = contributor.email
+    if contributor.email_hash:
+        node["emailHash"] = contributor.email_hash
+    if contributor.foaf_mbox_sha1sum:
+        node["mbox_sha1sum"] = contributor.foaf_mbox_sha1sum
+    return node
+
+
+_OSLC_CM = "http://open-services.net/ns/cm#"
+
+_SEV_URI: Dict[str, str] = {
+    "high": f"{_OSLC_CM}Critical",
+    "medium": f"{_OSLC_CM}Major",
+    "low": f"{_OSLC_CM}Minor",
+}
+_PRI_URI: Dict[str, str] = {
+    "high": f"{_OSLC_CM}PriorityHigh",
+    "medium": f"{_OSLC_CM}PriorityMedium",
+    "low": f"{_OSLC_CM}PriorityLow",
+}
+
+
+@lru_cache(maxsize=16)
 def _oslc_sev(sev: str) -> str:
     """Map severity level to OSLC CM severity URI.
 
@@ -250,14 +428,10 @@ def _oslc_sev(sev: str) -> str:
     Returns:
         OSLC CM severity URI. Defaults to Minor for unrecognized values.
     """
-    s = (sev or "").lower()
-    if s == "high":
-        return "http://open-services.net/ns/cm#Critical"
-    if s == "medium":
-        return "http://open-services.net/ns/cm#Major"
-    return "http://open-services.net/ns/cm#Minor"
+    return _SEV_URI.get((sev or "").lower(), _SEV_URI["low"])
 
 
+@lru_cache(maxsize=16)
 def _oslc_pri(pri: Optional[str]) -> Optional[str]:
     """Map priority level to OSLC CM priority URI.
 
@@ -271,120 +445,279 @@ def _oslc_pri(pri: Optional[str]) -> Optional[str]:
     """
     if not pri:
         return None
-    p = pri.lower()
-    if p == "high":
-        return "http://open-services.net/ns/cm#PriorityHigh"
-    if p == "medium":
-        return "http://open-services.net/ns/cm#PriorityMedium"
-    return "http://open-services.net/ns/cm#PriorityLow"
+    return _PRI_URI.get(pri.lower(), _PRI_URI["low"])
 
 
-def _serialize_issues(project: Project) -> list[Dict[str, Any]]:
-    """Serialize issues to JSON-LD OSLC Change Requests.
+@lru_cache(maxsize=64)
+def _issue_types(issue_type: str) -> tuple[str, ...]:
+    """Return the shared @type tuple for an issue category.
 
     Args:
-        project: Project containing issues to serialize
+        issue_type: Issue type CURIE (e.g. "repo:TodoComment")
 
     Returns:
-        List of issue nodes as OSLC CM Change Requests
+        ChangeRequest/Issue types, plus issue_type when it is more specific
     """
-    issues = []
-    for i in project.issues.values():
-        node = {
-            "@id": i.id,
-            "@type": (
-                ["oslc_cm:ChangeRequest", i.type, "repo:Issue"]
-                if i.type != "oslc_cm:ChangeRequest"
-                else ["oslc_cm:ChangeRequest", "repo:Issue"]
-            ),
-            "file": i.file_id,
-            "dcterms:title": i.title or i.description,
-            "description": i.description,
-            "severity": {"@id": _oslc_sev(i.severity)},
-        }
-        pri = _oslc_pri(i.priority)
-        if pri:
-            node["priority"] = {"@id": pri}
-        if i.status:
-            node["status"] = i.status
-        issues.append(node)
-    return issues
+    if issue_type == "oslc_cm:ChangeRequest":
+        return ("oslc_cm:ChangeRequest", "repo:Issue")
+    return ("oslc_cm:ChangeRequest", issue_type, "repo:Issue")
 
 
-def _serialize_dependencies_and_coupling(
-    project: Project,
-) -> tuple[list[Dict[str, Any]], list[Dict[str, Any]]]:
-    """Serialize dependency edges and coupling relationships.
+def _serialize_issue(issue: Issue) -> Dict[str, Any]:
+    """Serialize Issue entity to a JSON-LD OSLC Change Request.
 
     Args:
-        project: Project containing dependency/coupling data
+        issue: Issue model object
 
     Returns:
-        Tuple of (dependencies list, coupling list)
+        Dict with issue properties
     """
-    dependencies = [
-        {"source": e.source, "target": e.target, "weight": e.weight, "type": e.type}
-        for e in project.dependencies
-    ]
-    coupling = [{"a": c.a, "b": c.b, "weight": c.weight} for c in project.coupling]
-    return dependencies, coupling
+    node = {
+        "@id": issue.id,
+        "@type": _issue_types(issue.type),
+        "file": issue.file_id,
+        "dcterms:title": issue.title or issue.description,
+        "description": issue.description,
+        "severity": {"@id": _oslc_sev(issue.severity)},
+    }
+    pri = _oslc_pri(issue.priority)
+    if pri:
+        node["priority"] = {"@id": pri}
+    if issue.status:
+        node["status"] = issue.status
+    return node
+
+
+def _serialize_dependency(edge: DependencyEdge) -> Dict[str, Any]:
+    """Serialize a DependencyEdge to JSON-LD.
+
+    Args:
+        edge: DependencyEdge model object
+
+    Returns:
+        Dict with source, target, weight and type
+    """
+    return {"source": edge.source, "target": edge.target, "weight": edge.weight, "type": edge.type}
+
+
+def _serialize_coupling(edge: CouplingEdge) -> Dict[str, Any]:
+    """Serialize a CouplingEdge to JSON-LD.
+
+    Args:
+        edge: CouplingEdge model object
+
+    Returns:
+        Dict with both file ids and the co-change weight
+    """
+    return {"a": edge.a, "b": edge.b, "weight": edge.weight}
+
+
+def _serialize_commit(commit: Commit) -> Dict[str, Any]:
+    """Serialize a Commit as a PROV-O Activity.
+
+    Args:
+        commit: Commit model object
+
+    Returns:
+        Dict with commit properties
+    """
+    return {
+        "@id": commit.id,
+        "@type": _COMMIT_TYPES,
+        "dcterms:description": commit.message,
+        "endedAtTime": commit.ended_at,
+        "wasAssociatedWith": {"@id": commit.author_id} if commit.author_id else None,
+    }
+
+
+def _serialize_version(version: VersionResource) -> Dict[str, Any]:
+    """Serialize a VersionResource to OSLC Configuration Management.
+
+    Args:
+        version: VersionResource model object
+
+    Returns:
+        Dict with version properties
+    """
+    return {
+        "@id": version.id,
+        "@type": _VERSION_TYPES,
+        "versionId": version.version_id,
+        "branch": version.branch,
+        "committer": {"@id": version.committer} if version.committer else None,
+        "committed": version.committed,
+    }
+
 
+def _serialize_test_result(result: TestResult) -> Dict[str, Any]:
+    """Serialize a TestResult to an OSLC QM test result.
 
-def _serialize_commits_and_versions(
+    Args:
+        result: TestResult model object
+
+    Returns:
+        Dict with test result properties
+    """
+    return {
+        "@id": result.id,
+        "@type": _TEST_RESULT_TYPES,
+        "reportsOnTestCase": {"@id": result.testcase},
+        "status": result.status,
+        "time": result.time,
+        "description": result.message,
+    }
+
+
+def _entity_sections(
     project: Project,
-) -> tuple[list[Dict[str, Any]], list[Dict[str, Any]]]:
-    """Serialize commits as PROV-O Activities and version resources.
+) -> tuple[tuple[str, Callable[[Any], Dict[str, Any]], Iterable[Any]], ...]:
+    """Pair each top-level JSON-LD array key with its serializer and entities.
 
     Args:
-        project: Project containing commit/version history
+        project: Project to serialize
 
     Returns:
-        Tuple of (commits list, versions list)
+        Tuple of (key, serializer, entities) in output order
     """
-    commits = [
-        {
-            "@id": c.id,
-            "@type": ["prov:Activity", "repo:Commit"],
-            "dcterms:description": c.message,
-            "endedAtTime": c.ended_at,
-            "wasAssociatedWith": {"@id": c.author_id} if c.author_id else None,
-        }
-        for c in project.commits
-    ]
-    versions = [
-        {
-            "@id": v.id,
-            "@type": ["oslc_config:VersionResource"],
-            "versionId": v.version_id,
-            "branch": v.branch,
-            "committer": {"@id": v.committer} if v.committer else None,
-            "committed": v.committed,
-        }
-        for v in project.versions
-    ]
-    return commits, versions
+    return (
+        ("modules", _serialize_module, project.modules.values()),
+        ("files", _serialize_file, project.files.values()),
+        ("contributors", _serialize_contributor, project.contributors.values()),
+        ("issues", _serialize_issue, project.issues.values()),
+        ("dependencies", _serialize_dependency, project.dependencies),
+        ("coupling", _serialize_coupling, project.coupling),
+        ("commits", _serialize_commit, project.commits),
+        ("config", _serialize_version, project.versions),
+        ("tests", _serialize_test_result, project.tests_results),
+    )
+
+
+def _project_header(
+    project: Project,
+    context_file: Optional[str],
+    field33_context: Optional[str],
+) -> Dict[str, Any]:
+    """Validate the project and build its metadata node with merged context.
+
+    Args:
+        project: Project to serialize
+        context_file: Optional path to custom JSON-LD context file
+        field33_context: Optional path to Field33-specific context file
 
+    Returns:
+        Project metadata dict without the entity arrays
 
-def _serialize_tests(project: Project) -> list[Dict[str, Any]]:
-    """Serialize test results to OSLC QM test results.
+    Raises:
+        ValueError: If project.id is empty or None.
+    """
+    if not project.id:
+        raise ValueError("Project ID cannot be empty")
+
+    if not project.name:
+        logger.warning(f"Project {project.id} has no name set")
+
+    context = {"@context": _cached_merged_context(context_file, field33_context)}
+    return _build_project_metadata(project, context)
+
+
+if _HAS_ORJSON:
+    # Dataclasses are native in orjson 3; naive datetimes are taken as UTC
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values the stdlib json module rejects the way orjson does.
 
     Args:
-        project: Project containing test execution results
+        obj: Value json could not serialize
 
     Returns:
-        List of test result nodes
+        JSON-compatible replacement (ISO 8601 string or dict)
+
+    Raises:
+        TypeError: If obj has no JSON representation.
     """
-    return [
-        {
-            "@id": tr.id,
-            "@type": ["oslc_qm:TestResult"],
-            "reportsOnTestCase": {"@id": tr.testcase},
-            "status": tr.status,
-            "time": tr.time,
-            "description": tr.message,
-        }
-        for tr in project.tests_results
-    ]
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        text = obj.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        # Model classes know their fields; asdict() re-walks fields() per instance
+        to_dict = getattr(obj, "to_dict", None)
+        return to_dict() if to_dict is not None else asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode(obj: Any, pretty: bool) -> bytes:
+    """Encode a JSON value, compact or with two-space indentation.
+
+    Datetimes and dataclasses are accepted as-is (naive datetimes are UTC).
+
+    Args:
+        obj: JSON-serializable value
+        pretty: Indent with two spaces instead of emitting compact JSON
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if _HAS_ORJSON:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else _ORJSON_OPTIONS
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+    return text.encode("utf-8")
+
+
+def iter_jsonld_chunks(
+    project: Project,
+    context_file: Optional[str] = None,
+    field33_context: Optional[str] = None,
+    *,
+    pretty: bool = False,
+) -> Iterator[bytes]:
+    """Encode a Project as JSON-LD one entity node at a time.
+
+    Produces the same document as encoding ``to_jsonld(project)`` in one go,
+    but never holds more than one serialized node, so peak memory no longer
+    grows with the number of files and commits.
+
+    Args:
+        project: The Project model to export.
+        context_file: Optional path to custom JSON-LD context file.
+        field33_context: Optional path to Field33-specific context file.
+        pretty: Indent with two spaces; compact output is the default.
+
+    Yields:
+        Consecutive UTF-8 byte chunks of the JSON-LD document.
+
+    Raises:
+        ValueError: If project.id is empty or None.
+    """
+    header = _encode(_project_header(project, context_file, field33_context), pretty)
+    if pretty:
+        # Nodes sit two levels deep: shift their own indentation by four spaces
+        head_cut, key_open, key_close = 2, b",\n  ", b": ["
+        first_sep, item_sep, list_close, doc_close = b"\n    ", b",\n    ", b"\n  ]", b"\n}"
+    else:
+        head_cut, key_open, key_close = 1, b",", b":["
+        first_sep, item_sep, list_close, doc_close = b"", b",", b"]", b"}"
+
+    # Reopen the encoded header object (drop its closing brace) to append arrays
+    yield header[:-head_cut]
+    for key, serialize, entities in _entity_sections(project):
+        yield key_open + _encode(key, pretty) + key_close
+        sep, empty = first_sep, True
+        for node in map(serialize, entities):
+            encoded = _encode(node, pretty)
+            yield sep + (encoded.replace(b"\n", b"\n    ") if pretty else encoded)
+            sep, empty = item_sep, False
+        yield b"]" if empty else list_close
+    yield doc_close
 
 
 def to_jsonld(
@@ -424,42 +757,12 @@ def to_jsonld(
         >>> print(jsonld_data["@type"])
         ['repo:Project', 'schema:SoftwareSourceCode', ...]
     """
-    if not project.id:
-        raise ValueError("Project ID cannot be empty")
-
-    if not project.name:
-        logger.warning(f"Project {project.id} has no name set")
-
-    # Merge contexts
-    ctx_base = _load_context(DEFAULT_CONTEXT_PATH) or {"@context": {}}
-    context = _merge_contexts(ctx_base, context_file, field33_context)
-
-    # Build base metadata
-    data = _build_project_metadata(project, context)
-
-    # Serialize core entities
-    for m in project.modules.values():
-        data["modules"].append(_serialize_module(m))
-
-    for f in project.files.values():
-        data["files"].append(_serialize_file(f))
-
-    for p in project.contributors.values():
-        data["contributors"].append(_serialize_contributor(p))
-
-    # Serialize issues and relationships
-    data["issues"].extend(_serialize_issues(project))
-
-    deps, coupling = _serialize_dependencies_and_coupling(project)
-    data["dependencies"].extend(deps)
-    data["coupling"].extend(coupling)
-
-    commits, versions = _serialize_commits_and_versions(project)
-    data["commits"].extend(commits)
-    data["config"].extend(versions)
-
-    data["tests"].extend(_serialize_tests(project))
-
+    data = _project_header(project, context_file, field33_context)
+    # List comprehensions beat list(map(...)) for Python-level serializers
+    data.update(
+        (key, [serialize(entity) for entity in entities])
+        for key, serialize, entities in _entity_sections(project)
+    )
     return data
 
 
@@ -468,17 +771,22 @@ def dump_jsonld(
     path: str,
     context_file: Optional[str] = None,
     field33_context: Optional[str] = None,
+    *,
+    pretty: bool = False,
 ) -> None:
     """Export a Project model to JSON-LD file.
 
-    Converts the project to JSON-LD format and writes it to the specified file.
-    Uses orjson for fast serialization if available, falls back to standard json.
+    Streams the project to the specified file one entity node at a time (see
+    iter_jsonld_chunks). Serializes with orjson when installed (the 'full'
+    extra) and falls back to the standard json module.
 
     Args:
         project: The Project model to export.
         path: Output file path. Parent directories will be created if needed.
         context_file: Optional path to custom JSON-LD context file.
         field33_context: Optional path to Field33-specific context file.
+        pretty: Indent the output with two spaces. Defaults to compact JSON,
+            which is smaller and faster to encode.
 
     Raises:
         ValueError: If project.id is empty or path is invalid.
@@ -495,29 +803,22 @@ def dump_jsonld(
     output_path = Path(path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert to JSON-LD
-    data = to_jsonld(project, context_file=context_file, field33_context=field33_context)
+    logger.debug(
+        f"Streaming JSON-LD to {path} using {'orjson' if _HAS_ORJSON else 'standard json'}"
+    )
+    chunks = iter_jsonld_chunks(
+        project, context_file=context_file, field33_context=field33_context, pretty=pretty
+    )
+    # Pull the header first so validation errors surface before the file is created
+    first = next(chunks)
 
-    # Try fast serialization with orjson
     try:
-        import orjson
-
-        logger.debug(f"Writing JSON-LD to {path} using orjson")
-        with output_path.open("wb") as f:
-            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
-
-    except ImportError:
-        # Fallback to standard json
-        logger.debug(f"Writing JSON-LD to {path} using standard json (orjson not available)")
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-    except (OSError, IOError) as e:
+        with output_path.open("wb", buffering=1 << 20) as f:
+            f.write(first)
+            for chunk in chunks:
+                f.write(chunk)
+    except OSError as e:
         logger.error(f"Failed to write JSON-LD file {path}: {e}")
         raise
 
-    except Exception as e:
-        logger.exception(f"Unexpected error writing JSON-LD to {path}: {e}")
-        raise
-
     logger.info(f"Successfully exported JSON-LD to {path}")
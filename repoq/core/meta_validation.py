@@ -37,6 +37,14 @@ META_NS = "http://example.org/vocab/meta#"
 REPO_NS = "http://example.org/vocab/repo#"
 QUALITY_NS = "http://example.org/vocab/quality#"
 
+# Terms reused by export_self_analysis_rdf, resolved once instead of through
+# Namespace.__getattr__ on every export (and every violation)
+_META = Namespace(META_NS)
+_META_UNIVERSE_VIOLATION = _META.universeViolation
+_XSD_BOOLEAN = XSD.boolean
+_XSD_NON_NEGATIVE_INTEGER = XSD.nonNegativeInteger
+_XSD_DATETIME = XSD.dateTime
+
 
 @dataclass
 class SelfAnalysisResult:
@@ -76,33 +84,34 @@ def detect_circular_dependencies(project: Project) -> list[str]:
             deps = getattr(file, "dependencies", [])
             dep_graph[file_module] = set(deps)
 
-    # Detect cycles using DFS
-    visited = set()
-    rec_stack = set()
-
-    def dfs(node: str, path: list[str]) -> None:
-        if node in rec_stack:
-            # Found cycle
-            cycle_start = path.index(node)
-            cycle = path[cycle_start:] + [node]
-            circular_deps.append(" → ".join(cycle))
-            return
-
-        if node in visited:
-            return
-
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-
-        for neighbor in dep_graph.get(node, []):
-            dfs(neighbor, path.copy())
-
-        rec_stack.remove(node)
+    # Detect cycles using an iterative DFS: one shared path, no recursion limit
+    visited: set[str] = set()
+    rec_stack: set[str] = set()
 
     for module in dep_graph:
-        if module not in visited:
-            dfs(module, [])
+        if module in visited:
+            continue
+
+        visited.add(module)
+        rec_stack.add(module)
+        path = [module]
+        stack = [iter(dep_graph.get(module, ()))]
+
+        while stack:
+            neighbor = next(stack[-1], None)
+            if neighbor is None:
+                # All neighbors explored: leave the node
+                stack.pop()
+                rec_stack.discard(path.pop())
+            elif neighbor in rec_stack:
+                # Found cycle
+                cycle = path[path.index(neighbor) :] + [neighbor]
+                circular_deps.append(" → ".join(cycle))
+            elif neighbor not in visited:
+                visited.add(neighbor)
+                rec_stack.add(neighbor)
+                path.append(neighbor)
+                stack.append(iter(dep_graph.get(neighbor, ())))
 
     return circular_deps
 
@@ -123,19 +132,20 @@ def _file_path_to_module(file_path: str) -> Optional[str]:
         >>> _file_path_to_module("tests/test_foo.py")
         None  # Not a package module
     """
-    path = Path(file_path)
+    # Plain string ops: this runs per file and Path() construction dominated it
+    name = file_path.rpartition("/")[2]
 
-    # Only process Python files
-    if path.suffix != ".py":
+    # Only process Python files (absolute paths never map to package modules)
+    if not name.endswith(".py") or name == ".py" or file_path.startswith("/"):
         return None
 
     # Skip tests and setup files
-    if "test" in path.parts or path.name in ["setup.py", "__main__.py"]:
+    parts = [part for part in file_path[:-3].split("/") if part and part != "."]
+    if not parts or "test" in parts[:-1] or name in ("setup.py", "__main__.py"):
         return None
 
     # Convert path to module name
-    parts = path.with_suffix("").parts
-    if parts[0] in ["repoq", "src"]:
+    if parts[0] in ("repoq", "src"):
         module = ".".join(parts)
         if module.endswith(".__init__"):
             module = module[: -len(".__init__")]
@@ -144,6 +154,50 @@ def _file_path_to_module(file_path: str) -> Optional[str]:
     return None
 
 
+def _scan_meta_files(project: Project) -> tuple[list[str], list[str]]:
+    """
+    Run the stratification and universe checks in a single pass over files.
+
+    Each path is lowercased once and only meta/ontology files are inspected
+    further.
+
+    Args:
+        project: Project model to analyze
+
+    Returns:
+        Tuple of (stratification violations, universe violations)
+    """
+    stratification_violations = []
+    universe_violations = []
+
+    for file in project.files.values():
+        path_lower = file.path.lower()
+        if "meta" not in path_lower and "ontolog" not in path_lower:
+            continue
+
+        # Meta-level files must declare a stratification level within Russell's guard
+        level = getattr(file, "stratification_level", None)
+        if level is None:
+            stratification_violations.append(
+                f"Meta-level file {file.path} missing stratificationLevel"
+            )
+        elif level > 2:
+            stratification_violations.append(
+                f"File {file.path} has stratificationLevel={level} (max: 2, Russell's guard)"
+            )
+
+        # Heuristic: Look for files that both define and analyze same concept
+        # (a stem naming "ontology" implies the path matched above)
+        file_name_lower = Path(path_lower).stem
+        if "manager" in file_name_lower and "ontology" in file_name_lower:
+            # OntologyManager analyzing Ontology - potential universe collision
+            universe_violations.append(
+                f"{file.path}: Manager analyzes same concept it manages (universe collision risk)"
+            )
+
+    return stratification_violations, universe_violations
+
+
 def check_stratification_consistency(project: Project) -> list[str]:
     """
     Check stratification level consistency across project.
@@ -159,21 +213,7 @@ def check_stratification_consistency(project: Project) -> list[str]:
     Returns:
         List of stratification violation descriptions
     """
-    violations = []
-
-    # Check for meta-level files without declared level
-    meta_files = [
-        f for f in project.files.values() if "meta" in f.path.lower() or "ontolog" in f.path.lower()
-    ]
-
-    for file in meta_files:
-        level = getattr(file, "stratification_level", None)
-        if level is None:
-            violations.append(f"Meta-level file {file.path} missing stratificationLevel")
-        elif level > 2:
-            violations.append(f"File {file.path} has stratificationLevel={level} (max: 2, Russell's guard)")
-
-    return violations
+    return _scan_meta_files(project)[0]
 
 
 def detect_universe_violations(project: Project) -> list[str]:
@@ -192,22 +232,7 @@ def detect_universe_violations(project: Project) -> list[str]:
     Examples:
         ["OntologyManager analyzes Ontology at same level (unsafe)"]
     """
-    violations = []
-
-    # Check for self-referential patterns in ontology/meta code
-    for file in project.files.values():
-        if "ontology" in file.path.lower() or "meta" in file.path.lower():
-            # Check if file analyzes/processes same concepts it defines
-            file_name_lower = Path(file.path).stem.lower()
-
-            # Heuristic: Look for files that both define and analyze same concept
-            if "manager" in file_name_lower and "ontology" in file_name_lower:
-                # OntologyManager analyzing Ontology - potential universe collision
-                violations.append(
-                    f"{file.path}: Manager analyzes same concept it manages (universe collision risk)"
-                )
-
-    return violations
+    return _scan_meta_files(project)[1]
 
 
 def perform_self_analysis(
@@ -235,8 +260,7 @@ def perform_self_analysis(
 
     # Run safety checks
     circular_deps = detect_circular_dependencies(project)
-    stratification_violations = check_stratification_consistency(project)
-    universe_violations = detect_universe_violations(project)
+    stratification_violations, universe_violations = _scan_meta_files(project)
 
     # Aggregate safety status
     safety_passed = (
@@ -269,62 +293,59 @@ def export_self_analysis_rdf(graph: Graph, result: SelfAnalysisResult) -> None:
     Side Effects:
         Modifies `graph` in-place by adding triples
     """
-    META = Namespace(META_NS)
-    REPO = Namespace(REPO_NS)
-
     # Add namespace binding
-    graph.bind("meta", META)
+    graph.bind("meta", _META)
 
     # Create SelfAnalysis node
     analysis_id = f"{result.project_id}/meta/self-analysis"
     analysis_uri = URIRef(analysis_id)
 
-    graph.add((analysis_uri, RDF.type, META.SelfAnalysis))
-
-    # Stratification properties
-    graph.add(
+    triples = [
+        (analysis_uri, RDF.type, _META.SelfAnalysis),
+        # Stratification properties
         (
             analysis_uri,
-            META.stratificationLevel,
-            Literal(result.stratification_level, datatype=XSD.nonNegativeInteger),
-        )
-    )
-    graph.add((analysis_uri, META.readOnlyMode, Literal(result.read_only_mode, datatype=XSD.boolean)))
-    graph.add((analysis_uri, META.maxSafeLevel, Literal(2, datatype=XSD.nonNegativeInteger)))  # Russell's guard
-
-    # Self-reference detection
-    graph.add(
+            _META.stratificationLevel,
+            Literal(result.stratification_level, datatype=_XSD_NON_NEGATIVE_INTEGER),
+        ),
+        (analysis_uri, _META.readOnlyMode, Literal(result.read_only_mode, datatype=_XSD_BOOLEAN)),
+        # Russell's guard
+        (analysis_uri, _META.maxSafeLevel, Literal(2, datatype=_XSD_NON_NEGATIVE_INTEGER)),
+        # Self-reference detection
         (
             analysis_uri,
-            META.selfReferenceDetected,
-            Literal(result.self_reference_detected, datatype=XSD.boolean),
-        )
-    )
-
-    # Safety status
-    graph.add(
-        (analysis_uri, META.safetyChecksPassed, Literal(result.safety_checks_passed, datatype=XSD.boolean))
-    )
-
-    # Timestamp
-    graph.add((analysis_uri, META.performedAt, Literal(result.performed_at, datatype=XSD.dateTime)))
+            _META.selfReferenceDetected,
+            Literal(result.self_reference_detected, datatype=_XSD_BOOLEAN),
+        ),
+        # Safety status
+        (
+            analysis_uri,
+            _META.safetyChecksPassed,
+            Literal(result.safety_checks_passed, datatype=_XSD_BOOLEAN),
+        ),
+        # Timestamp
+        (analysis_uri, _META.performedAt, Literal(result.performed_at, datatype=_XSD_DATETIME)),
+        # Link to analyzed project
+        (analysis_uri, _META.analyzesSelf, URIRef(result.project_id)),
+    ]
 
     # Commit SHA
     if result.analyzed_commit:
-        graph.add((analysis_uri, META.analyzedCommit, Literal(result.analyzed_commit)))
+        triples.append((analysis_uri, _META.analyzedCommit, Literal(result.analyzed_commit)))
 
     # Circular dependencies
-    for cycle in result.circular_dependencies:
-        violation_msg = f"Circular dependency: {cycle}"
-        graph.add((analysis_uri, META.universeViolation, Literal(violation_msg)))
+    triples.extend(
+        (analysis_uri, _META_UNIVERSE_VIOLATION, Literal(f"Circular dependency: {cycle}"))
+        for cycle in result.circular_dependencies
+    )
 
     # Universe violations
-    for violation in result.universe_violations:
-        graph.add((analysis_uri, META.universeViolation, Literal(violation)))
+    triples.extend(
+        (analysis_uri, _META_UNIVERSE_VIOLATION, Literal(violation))
+        for violation in result.universe_violations
+    )
 
-    # Link to analyzed project
-    project_uri = URIRef(result.project_id)
-    graph.add((analysis_uri, META.analyzesSelf, project_uri))
+    graph.addN((s, p, o, graph) for s, p, o in triples)
 
 
 def enrich_graph_with_self_analysis(
@@ -33,13 +33,21 @@ from __future__ import annotations
 import hashlib
 import json
 import threading
-from collections import OrderedDict
-from dataclasses import asdict, dataclass
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
 from .. import __version__
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson ships with the 'full' extra
+    orjson = None
+    _HAS_ORJSON = False
+
 
 @dataclass
 class CachedMetrics:
@@ -54,6 +62,16 @@ class CachedMetrics:
         timestamp: ISO 8601 timestamp of analysis
     """
 
+    # Explicit slots (dataclass(slots=True) needs 3.10): up to max_size of these stay live
+    __slots__ = (
+        "file_path",
+        "file_sha",
+        "policy_version",
+        "repoq_version",
+        "metrics",
+        "timestamp",
+    )
+
     file_path: str
     file_sha: str
     policy_version: str
@@ -78,6 +96,9 @@ class MetricCache:
     Attributes:
         max_size: Maximum number of cache entries (default: 10000)
         _cache: OrderedDict for LRU semantics
+        _version_counts: Entry count per (policy_version, repoq_version)
+        _hits: Number of get() calls that found an entry
+        _misses: Number of get() calls that found nothing
         _lock: Threading lock for safe concurrent access
 
     Example:
@@ -99,8 +120,34 @@ class MetricCache:
         """
         self.max_size = max_size
         self._cache: OrderedDict[str, CachedMetrics] = OrderedDict()
+        self._version_counts: Counter[tuple[str, str]] = Counter()
+        self._hits = 0
+        self._misses = 0
         self._lock = threading.Lock()
 
+    def _count(self, cached: CachedMetrics, delta: int) -> None:
+        """Track entries per version pair (caller must hold the lock)."""
+        versions = (cached.policy_version, cached.repoq_version)
+        self._version_counts[versions] += delta
+        if self._version_counts[versions] <= 0:
+            del self._version_counts[versions]
+
+    def has_entries(self, policy_version: str, repoq_version: str | None = None) -> bool:
+        """Check whether any entry exists for a policy/RepoQ version pair.
+
+        An O(1) prefilter: when it returns False every lookup for these
+        versions is a miss, so callers can skip hashing file content.
+
+        Args:
+            policy_version: Quality policy version
+            repoq_version: RepoQ version (defaults to current)
+
+        Returns:
+            True if at least one entry matches both versions
+        """
+        with self._lock:
+            return (policy_version, repoq_version or __version__) in self._version_counts
+
     def _make_key(
         self,
         file_sha: str,
@@ -120,11 +167,15 @@ class MetricCache:
         repoq_ver = repoq_version or __version__
         return f"{file_sha}_{policy_version}_{repoq_ver}"
 
-    def _compute_file_sha(self, content: bytes) -> str:
+    def _compute_file_sha(self, content: bytes | memoryview) -> str:
         """Compute SHA256 of file content.
 
+        hashlib's sha256 is OpenSSL-backed (SHA-NI / ARMv8 crypto where the CPU
+        has them) and hashes the whole buffer in one call with the GIL
+        released, so content is passed straight through, never chunked or copied.
+
         Args:
-            content: File content as bytes
+            content: File content as bytes or a memoryview over it
 
         Returns:
             Hexadecimal SHA256 digest
@@ -150,11 +201,14 @@ class MetricCache:
         key = self._make_key(file_sha, policy_version, repoq_version)
 
         with self._lock:
-            if key in self._cache:
+            cached = self._cache.get(key)
+            if cached is not None:
                 # Move to end (most recently used)
                 self._cache.move_to_end(key)
-                return self._cache[key]
-            return None
+                self._hits += 1
+            else:
+                self._misses += 1
+            return cached
 
     def set(
         self,
@@ -188,19 +242,21 @@ class MetricCache:
         )
 
         with self._lock:
-            # Add to cache (or update if exists)
+            # Add to cache (or update if exists); re-inserting puts the key at the end
+            if self._cache.pop(key, None) is None:
+                self._count(cached, 1)
             self._cache[key] = cached
-            self._cache.move_to_end(key)
 
             # LRU eviction if over max_size
             if len(self._cache) > self.max_size:
                 # Remove oldest (first item)
-                self._cache.popitem(last=False)
+                _, evicted = self._cache.popitem(last=False)
+                self._count(evicted, -1)
 
     def get_or_compute(
         self,
         file_path: str,
-        file_content: bytes,
+        file_content: bytes | memoryview,
         policy_version: str,
         compute_fn: Callable[[], Dict[str, Any]],
         timestamp: str,
@@ -212,7 +268,7 @@ class MetricCache:
 
         Args:
             file_path: Path to file being analyzed
-            file_content: File content as bytes
+            file_content: File content as bytes (or a memoryview over it)
             policy_version: Quality policy version
             compute_fn: Function to compute metrics if cache miss
             timestamp: ISO 8601 timestamp
@@ -267,6 +323,7 @@ class MetricCache:
                 # Clear entire cache
                 count = len(self._cache)
                 self._cache.clear()
+                self._version_counts.clear()
                 return count
             else:
                 # Invalidate entries with matching policy version
@@ -276,7 +333,7 @@ class MetricCache:
                     if cached.policy_version == policy_version
                 ]
                 for key in to_remove:
-                    del self._cache[key]
+                    self._count(self._cache.pop(key), -1)
                 return len(to_remove)
 
     def size(self) -> int:
@@ -285,34 +342,61 @@ class MetricCache:
             return len(self._cache)
 
     def hit_rate(self, reset: bool = False) -> float:
-        """Calculate cache hit rate (requires statistics tracking).
+        """Calculate cache hit rate over get() calls.
 
-        Note: This is a placeholder. Implement hit/miss counters if needed.
+        Lookups through get_or_compute() are counted as well.
 
         Args:
             reset: Whether to reset counters after calculating
 
         Returns:
-            Hit rate as float (0.0 to 1.0)
+            Hit rate as float (0.0 to 1.0), 0.0 if nothing was looked up yet
         """
-        # TODO: Implement hit/miss tracking if needed
-        return 0.0
+        with self._lock:
+            rate = self._hits / ((self._hits + self._misses) or 1)
+            if reset:
+                self._hits = 0
+                self._misses = 0
+            return rate
 
     def save(self, path: Path) -> None:
         """Save cache to disk (JSON format).
 
+        Encodes with orjson when installed (the 'full' extra) and writes the
+        document in one call; falls back to the standard json module.
+
         Args:
             path: Path to save cache file
         """
         with self._lock:
+            if _HAS_ORJSON:
+                # orjson serializes dataclasses natively; no intermediate dicts
+                entries: list[Any] = list(self._cache.values())
+            else:
+                entries = [
+                    {
+                        "file_path": cached.file_path,
+                        "file_sha": cached.file_sha,
+                        "policy_version": cached.policy_version,
+                        "repoq_version": cached.repoq_version,
+                        "metrics": cached.metrics,
+                        "timestamp": cached.timestamp,
+                    }
+                    for cached in self._cache.values()
+                ]
             data = {
                 "version": "1.0",
                 "max_size": self.max_size,
-                "entries": [asdict(cached) for cached in self._cache.values()],
+                "entries": entries,
             }
 
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            if _HAS_ORJSON:
+                path.write_bytes(
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
 
     def load(self, path: Path) -> int:
         """Load cache from disk (JSON format).
@@ -326,11 +410,15 @@ class MetricCache:
         if not path.exists():
             return 0
 
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        if _HAS_ORJSON:
+            data = orjson.loads(path.read_bytes())
+        else:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
 
         with self._lock:
             self._cache.clear()
+            self._version_counts.clear()
 
             for entry in data.get("entries", []):
                 cached = CachedMetrics(**entry)
@@ -339,6 +427,8 @@ class MetricCache:
                     cached.policy_version,
                     cached.repoq_version,
                 )
+                if key not in self._cache:
+                    self._count(cached, 1)
                 self._cache[key] = cached
 
             return len(self._cache)
@@ -8,15 +8,18 @@ issues, and relationships.
 from __future__ import annotations
 
 import hashlib
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
+@lru_cache(maxsize=4096)
 def hash_email(email: str) -> str:
     """Create a truncated SHA256 hash of an email address.
 
     Used for creating short, anonymized identifiers for contributors
-    without exposing full email addresses.
+    without exposing full email addresses. Memoized, since history mining
+    hashes the same author email once per commit.
 
     Args:
         email: Email address to hash. Empty string returns empty string.
@@ -33,6 +36,7 @@ def hash_email(email: str) -> str:
     return hashlib.sha256(email.encode("utf-8")).hexdigest()[:16]
 
 
+@lru_cache(maxsize=4096)
 def foaf_sha1(email: str) -> str:
     """Create FOAF mbox_sha1sum hash for an email address.
 
@@ -93,6 +97,21 @@ class FunctionMetrics:
     expected_delta_q: Optional[float] = None  # T1.3: Per-function ΔQ estimation
     refactoring_priority: Optional[str] = None  # T1.3: "critical", "high", "medium", "low"
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "name": self.name,
+            "cyclomatic_complexity": self.cyclomatic_complexity,
+            "lines_of_code": self.lines_of_code,
+            "parameters": self.parameters,
+            "start_line": self.start_line,
+            "end_line": self.end_line,
+            "token_count": self.token_count,
+            "max_nesting_depth": self.max_nesting_depth,
+            "expected_delta_q": self.expected_delta_q,
+            "refactoring_priority": self.refactoring_priority,
+        }
+
 
 @dataclass
 class Issue:
@@ -123,6 +142,20 @@ class Issue:
     title: Optional[str] = None
     metadata: dict = field(default_factory=dict)
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "file_id": self.file_id,
+            "description": self.description,
+            "severity": self.severity,
+            "priority": self.priority,
+            "status": self.status,
+            "title": self.title,
+            "metadata": self.metadata,
+        }
+
 
 @dataclass
 class Person:
@@ -155,6 +188,21 @@ class Person:
     owns: List[str] = field(default_factory=list)
     modules_contributed: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "email": self.email,
+            "email_hash": self.email_hash,
+            "foaf_mbox_sha1sum": self.foaf_mbox_sha1sum,
+            "commits": self.commits,
+            "lines_added": self.lines_added,
+            "lines_deleted": self.lines_deleted,
+            "owns": self.owns,
+            "modules_contributed": self.modules_contributed,
+        }
+
 
 @dataclass
 class File:
@@ -202,6 +250,31 @@ class File:
     checksum_value: Optional[str] = None
     functions: Optional[List[FunctionMetrics]] = None
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "path": self.path,
+            "language": self.language,
+            "lines_of_code": self.lines_of_code,
+            "complexity": self.complexity,
+            "maintainability": self.maintainability,
+            "commits_count": self.commits_count,
+            "code_churn": self.code_churn,
+            "contributors": self.contributors,
+            "issues": self.issues,
+            "last_modified": self.last_modified,
+            "deprecated": self.deprecated,
+            "test_file": self.test_file,
+            "module": self.module,
+            "hotness": self.hotness,
+            "checksum_algo": self.checksum_algo,
+            "checksum_value": self.checksum_value,
+            "functions": (
+                [f.to_dict() for f in self.functions] if self.functions is not None else None
+            ),
+        }
+
 
 @dataclass
 class Module:
@@ -235,6 +308,22 @@ class Module:
     hotspot_score: Optional[float] = None
     main_language: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "path": self.path,
+            "contains_files": self.contains_files,
+            "contains_modules": self.contains_modules,
+            "total_loc": self.total_loc,
+            "total_commits": self.total_commits,
+            "num_authors": self.num_authors,
+            "owner": self.owner,
+            "hotspot_score": self.hotspot_score,
+            "main_language": self.main_language,
+        }
+
 
 @dataclass
 class DependencyEdge:
@@ -256,6 +345,17 @@ class DependencyEdge:
     version_constraint: Optional[str] = None  # Normalized SemVer range
     original_constraint: Optional[str] = None  # Original constraint from manifest
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "source": self.source,
+            "target": self.target,
+            "weight": self.weight,
+            "type": self.type,
+            "version_constraint": self.version_constraint,
+            "original_constraint": self.original_constraint,
+        }
+
 
 @dataclass
 class CouplingEdge:
@@ -271,6 +371,14 @@ class CouplingEdge:
     b: str  # file id
     weight: int = 1
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "a": self.a,
+            "b": self.b,
+            "weight": self.weight,
+        }
+
 
 @dataclass
 class Commit:
@@ -283,11 +391,22 @@ class Commit:
         ended_at: ISO 8601 timestamp of commit (default: None)
     """
 
+    __slots__ = ("id", "message", "author_id", "ended_at")
+
     id: str
     message: str
     author_id: Optional[str]
     ended_at: Optional[str]
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "message": self.message,
+            "author_id": self.author_id,
+            "ended_at": self.ended_at,
+        }
+
 
 @dataclass
 class VersionResource:
@@ -301,12 +420,24 @@ class VersionResource:
         committed: ISO 8601 timestamp of commit (default: None)
     """
 
+    __slots__ = ("id", "version_id", "branch", "committer", "committed")
+
     id: str
     version_id: str
     branch: Optional[str]
     committer: Optional[str]
     committed: Optional[str]
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "version_id": self.version_id,
+            "branch": self.branch,
+            "committer": self.committer,
+            "committed": self.committed,
+        }
+
 
 @dataclass
 class TestCase:
@@ -322,6 +453,14 @@ class TestCase:
     name: str
     classname: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "classname": self.classname,
+        }
+
 
 @dataclass
 class TestResult:
@@ -341,6 +480,16 @@ class TestResult:
     time: Optional[float] = None
     message: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "id": self.id,
+            "testcase": self.testcase,
+            "status": self.status,
+            "time": self.time,
+            "message": self.message,
+        }
+
 
 @dataclass
 class Project:
@@ -398,8 +547,8 @@ class Project:
         """Convert Project to plain dictionary for JSON serialization.
 
         Returns:
-            Dictionary with all Project attributes, recursively converting
-            nested dataclasses to dicts using dataclasses.asdict().
+            Dictionary with all Project attributes, converting nested
+            dataclasses with their own to_dict() (containers are shared, not copied).
         """
         return {
             "id": self.id,
@@ -410,14 +559,14 @@ class Project:
             "programming_languages": self.programming_languages,
             "last_commit_date": self.last_commit_date,
             "ci_configured": self.ci_configured,
-            "modules": {k: asdict(v) for k, v in self.modules.items()},
-            "files": {k: asdict(v) for k, v in self.files.items()},
-            "contributors": {k: asdict(v) for k, v in self.contributors.items()},
-            "issues": {k: asdict(v) for k, v in self.issues.items()},
-            "dependencies": [asdict(e) for e in self.dependencies],
-            "coupling": [asdict(e) for e in self.coupling],
-            "commits": [asdict(c) for c in self.commits],
-            "versions": [asdict(v) for v in self.versions],
-            "tests_cases": {k: asdict(v) for k, v in self.tests_cases.items()},
-            "tests_results": [asdict(r) for r in self.tests_results],
+            "modules": {k: v.to_dict() for k, v in self.modules.items()},
+            "files": {k: v.to_dict() for k, v in self.files.items()},
+            "contributors": {k: v.to_dict() for k, v in self.contributors.items()},
+            "issues": {k: v.to_dict() for k, v in self.issues.items()},
+            "dependencies": [e.to_dict() for e in self.dependencies],
+            "coupling": [e.to_dict() for e in self.coupling],
+            "commits": [c.to_dict() for c in self.commits],
+            "versions": [v.to_dict() for v in self.versions],
+            "tests_cases": {k: v.to_dict() for k, v in self.tests_cases.items()},
+            "tests_results": [r.to_dict() for r in self.tests_results],
         }
@@ -5,6 +5,7 @@ Quality recommendations RDF export module.
 Включает приоритизацию и linking к затронутым файлам/функциям.
 """
 
+import re
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
@@ -13,13 +14,33 @@ from typing import List, Optional
 from rdflib import RDF, Graph, Literal, Namespace, URIRef
 from rdflib.namespace import XSD
 
-from ..refactoring import RefactoringTask, generate_refactoring_plan
+from ..refactoring import RefactoringTask, generate_refactoring_plan_from_data
+from .jsonld import to_jsonld
 from .model import Project
 
 # Namespaces
 QUALITY_NS = "http://example.org/vocab/quality#"
 REPO_NS = "http://example.org/vocab/repo#"
 
+# Effort strings produced by refactoring.py ("15 min", "1 hour", "2-4 hours")
+_MIN_RE = re.compile(r"(\d+)\s*min")
+_HOUR_RANGE_RE = re.compile(r"(\d+)-(\d+)\s*hour")
+_HOUR_RE = re.compile(r"(\d+)\s*hour")
+
+# RDF terms used per recommendation, resolved once rather than through
+# Namespace.__getattr__ (a new URIRef each time) inside the export loop
+_QUALITY = Namespace(QUALITY_NS)
+_RDF_TYPE = RDF.type
+_XSD_DECIMAL = XSD.decimal
+_Q_RECOMMENDATION = _QUALITY.Recommendation
+_Q_TITLE = _QUALITY.recommendationTitle
+_Q_DESCRIPTION = _QUALITY.recommendationDescription
+_Q_DELTA_Q = _QUALITY.deltaQ
+_Q_PRIORITY = _QUALITY.priority
+_Q_EFFORT_HOURS = _QUALITY.estimatedEffortHours
+_Q_TARGETS_FILE = _QUALITY.targetsFile
+_Q_TARGETS_FUNCTION = _QUALITY.targetsFunction
+
 
 @dataclass
 class QualityRecommendation:
@@ -52,11 +73,12 @@ def convert_refactoring_task_to_recommendation(
     effort_hours = _parse_effort_hours(task.estimated_effort)
 
     # Generate description from issues and recommendations
-    description_parts = ["Issues: " + "; ".join(task.issues[:3])]
+    issues_str = "; ".join(task.issues[:3])
     if task.recommendations:
-        description_parts.append("Recommendations: " + "; ".join(task.recommendations[:2]))
-
-    description = " | ".join(description_parts)
+        recs_str = "; ".join(task.recommendations[:2])
+        description = f"Issues: {issues_str} | Recommendations: {recs_str}"
+    else:
+        description = f"Issues: {issues_str}"
 
     return QualityRecommendation(
         id=f"{project_id}/quality/recommendation_{task.id}",
@@ -89,25 +111,21 @@ def _parse_effort_hours(effort_str: str) -> float:
 
     if "min" in effort_str:
         # Extract number before "min"
-        import re
-
-        match = re.search(r"(\d+)\s*min", effort_str)
+        match = _MIN_RE.search(effort_str)
         if match:
             return float(match.group(1)) / 60.0
 
     elif "hour" in effort_str:
         # Extract number(s) before "hour"
-        import re
-
         # Handle ranges like "2-4 hours"
-        range_match = re.search(r"(\d+)-(\d+)\s*hour", effort_str)
+        range_match = _HOUR_RANGE_RE.search(effort_str)
         if range_match:
             low = float(range_match.group(1))
             high = float(range_match.group(2))
             return (low + high) / 2.0
 
         # Handle single number like "1 hour"
-        single_match = re.search(r"(\d+)\s*hour", effort_str)
+        single_match = _HOUR_RE.search(effort_str)
         if single_match:
             return float(single_match.group(1))
 
@@ -129,41 +147,40 @@ def export_recommendations_rdf(
     Side Effects:
         Modifies `graph` in-place by adding triples
     """
-    QUALITY = Namespace(QUALITY_NS)
-
     # Add namespace binding
-    graph.bind("quality", QUALITY)
+    graph.bind("quality", _QUALITY)
 
+    # Collect every triple first and add them in one batched addN call
+    triples = []
     for rec in recommendations:
         rec_uri = URIRef(rec.id)
-        graph.add((rec_uri, RDF.type, QUALITY.Recommendation))
-        graph.add((rec_uri, QUALITY.recommendationTitle, Literal(rec.title)))
-        graph.add((rec_uri, QUALITY.recommendationDescription, Literal(rec.description)))
-
-        # ΔQ (the key metric)
-        graph.add((rec_uri, QUALITY.deltaQ, Literal(rec.delta_q, datatype=XSD.decimal)))
-
-        # Priority
-        graph.add((rec_uri, QUALITY.priority, Literal(rec.priority)))
-
-        # Estimated effort
-        graph.add(
+        triples += [
+            (rec_uri, _RDF_TYPE, _Q_RECOMMENDATION),
+            (rec_uri, _Q_TITLE, Literal(rec.title)),
+            (rec_uri, _Q_DESCRIPTION, Literal(rec.description)),
+            # ΔQ (the key metric)
+            (rec_uri, _Q_DELTA_Q, Literal(rec.delta_q, datatype=_XSD_DECIMAL)),
+            # Priority
+            (rec_uri, _Q_PRIORITY, Literal(rec.priority)),
+            # Estimated effort
             (
                 rec_uri,
-                QUALITY.estimatedEffortHours,
-                Literal(rec.estimated_effort_hours, datatype=XSD.decimal),
-            )
-        )
+                _Q_EFFORT_HOURS,
+                Literal(rec.estimated_effort_hours, datatype=_XSD_DECIMAL),
+            ),
+        ]
 
         # Link to target file
         if rec.target_file:
             file_uri = URIRef(f"{project_id}/{rec.target_file}")
-            graph.add((rec_uri, QUALITY.targetsFile, file_uri))
+            triples.append((rec_uri, _Q_TARGETS_FILE, file_uri))
 
         # Link to target function (if available)
         if rec.target_function:
             function_uri = URIRef(f"{project_id}/{rec.target_file}/fn/{rec.target_function}")
-            graph.add((rec_uri, QUALITY.targetsFunction, function_uri))
+            triples.append((rec_uri, _Q_TARGETS_FUNCTION, function_uri))
+
+    graph.addN((s, p, o, graph) for s, p, o in triples)
 
 
 def generate_recommendations_from_project(
@@ -186,36 +203,20 @@ def generate_recommendations_from_project(
     if not project.files:
         return []
 
-    # Convert project to JSON-LD for refactoring.py
-    import json
-    from tempfile import NamedTemporaryFile
-
-    from .jsonld import to_jsonld
-
-    with NamedTemporaryFile(mode="w", suffix=".jsonld", delete=False) as tmp:
-        jsonld_data = to_jsonld(project)
-        json.dump(jsonld_data, tmp)
-        tmp_path = tmp.name
-
-    try:
-        # Generate refactoring plan using existing algorithm
-        plan = generate_refactoring_plan(tmp_path, top_k=top_k, min_delta_q=min_delta_q)
-
-        # Convert tasks to recommendations
-        recommendations = [
-            convert_refactoring_task_to_recommendation(task, project.id) for task in plan.tasks
-        ]
+    # Hand the in-memory JSON-LD to refactoring.py (no temp file round-trip)
+    plan = generate_refactoring_plan_from_data(
+        to_jsonld(project), top_k=top_k, min_delta_q=min_delta_q
+    )
 
-        # Sort by ΔQ descending
-        recommendations.sort(key=lambda r: float(r.delta_q), reverse=True)
+    # Convert tasks to recommendations
+    recommendations = [
+        convert_refactoring_task_to_recommendation(task, project.id) for task in plan.tasks
+    ]
 
-        return recommendations
-    finally:
-        # Cleanup temp file
-        import os
+    # Sort by ΔQ descending
+    recommendations.sort(key=lambda r: float(r.delta_q), reverse=True)
 
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+    return recommendations
 
 
 def _project_to_refactoring_input(project: Project) -> dict:
@@ -9,19 +9,44 @@ Requires optional dependencies: rdflib, pyshacl (install with: pip install repoq
 
 from __future__ import annotations
 
-import json
+import itertools
 import logging
-from typing import TYPE_CHECKING, Optional
+import os
+import re
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple, cast
 
 from ..normalize.rdf_trs import canonicalize_rdf
 from .jsonld import to_jsonld
 from .model import Project
 
-if TYPE_CHECKING:
-    from rdflib import Graph
+try:
+    from rdflib import Graph, Literal, Namespace, URIRef
+    from rdflib.namespace import RDF, RDFS, SH, XSD
+    from rdflib.term import IdentifiedNode, Node
+
+    _SH_VALIDATION_RESULT = SH.ValidationResult
+    _SH_FOCUS_NODE = SH.focusNode
+    _SH_RESULT_MESSAGE = SH.resultMessage
+    _SH_RESULT_SEVERITY = SH.resultSeverity
+    _SH_VALUE = SH.value
+    # Without any of these in the data graph, RDFS inference only adds axiomatic triples
+    _RDFS_SCHEMA_PREDICATES = (RDFS.subClassOf, RDFS.subPropertyOf, RDFS.domain, RDFS.range)
+
+    _HAS_RDFLIB = True
+except ImportError:
+    _HAS_RDFLIB = False
 
 logger = logging.getLogger(__name__)
 
+# Local names that can be written as prefix:local without escaping (Turtle PN_LOCAL subset)
+_PN_LOCAL_RE = re.compile(r"[A-Za-z0-9_](?:[A-Za-z0-9_.-]*[A-Za-z0-9_-])?")
+
+# File extensions loaded from a SHACL shapes directory
+_SHAPE_SUFFIXES = frozenset({"ttl", "rdf", "nt"})
+
 # Namespace prefixes for new ontologies
 META_NS = "http://example.org/vocab/meta#"
 TEST_NS = "http://example.org/vocab/test#"
@@ -29,6 +54,20 @@ TRS_NS = "http://example.org/vocab/trs#"
 QUALITY_NS = "http://example.org/vocab/quality#"
 DOCS_NS = "http://example.org/vocab/docs#"
 
+if _HAS_RDFLIB:
+    # Built once: every meta enrichment reuses the same namespaces and constant literals
+    _META = Namespace(META_NS)
+    _TEST = Namespace(TEST_NS)
+    _QUALITY = Namespace(QUALITY_NS)
+    _DOCS = Namespace(DOCS_NS)
+    _LIT_TRUE = Literal(True, datatype=XSD.boolean)
+    _LIT_FALSE = Literal(False, datatype=XSD.boolean)
+    _LIT_LEVEL_ZERO = Literal(0, datatype=XSD.nonNegativeInteger)
+    _LIT_COMPLEXITY_THRESHOLD = Literal(15.0, datatype=XSD.decimal)
+    _LIT_ZERO_PERCENT = Literal(Decimal(0), datatype=XSD.decimal)
+    _LIT_PASSED = Literal("passed")
+    _LIT_FAILED = Literal("failed")
+
 
 def _build_data_graph(
     project: Project,
@@ -48,14 +87,16 @@ def _build_data_graph(
     Raises:
         ImportError: If rdflib not available
     """
-    from rdflib import Graph
-    
+    if not _HAS_RDFLIB:
+        raise ImportError("rdflib is required to build the RDF data graph")
+
     data_graph = Graph()
     data = to_jsonld(project, context_file=context_file, field33_context=field33_context)
     
-    # Canonicalize JSON-LD for consistent validation
+    # Canonicalize JSON-LD for deterministic output
     canonical_data = canonicalize_rdf(data)
-    data_graph.parse(data=json.dumps(canonical_data), format="json-ld")
+    # Hand the dict to rdflib directly; a json.dumps round trip would only be re-parsed
+    data_graph.parse(data=canonical_data, format="json-ld")
     
     return data_graph
 
@@ -97,7 +138,7 @@ def _apply_enrichments(
         from .test_coverage import enrich_graph_with_test_coverage
         try:
             enrich_graph_with_test_coverage(data_graph, project.id, coverage_path)
-            logger.info("Successfully enriched RDF with test coverage for validation")
+            logger.info("Successfully enriched RDF with test coverage")
         except Exception as e:
             logger.warning(f"Failed to enrich with test coverage: {e}")
 
@@ -105,7 +146,7 @@ def _apply_enrichments(
         from .trs_rules import enrich_graph_with_trs_rules
         try:
             enrich_graph_with_trs_rules(data_graph, project.id)
-            logger.info("Successfully enriched RDF with TRS rules for validation")
+            logger.info("Successfully enriched RDF with TRS rules")
         except Exception as e:
             logger.warning(f"Failed to enrich with TRS rules: {e}")
 
@@ -115,7 +156,7 @@ def _apply_enrichments(
             enrich_graph_with_quality_recommendations(
                 data_graph, project, top_k=top_k_recommendations, min_delta_q=min_delta_q
             )
-            logger.info("Successfully enriched RDF with quality recommendations for validation")
+            logger.info("Successfully enriched RDF with quality recommendations")
         except Exception as e:
             logger.warning(f"Failed to enrich with quality recommendations: {e}")
 
@@ -125,38 +166,73 @@ def _apply_enrichments(
             enrich_graph_with_self_analysis(
                 data_graph, project, stratification_level=stratification_level, analyzed_commit=analyzed_commit
             )
-            logger.info("Successfully enriched RDF with self-analysis for validation")
+            logger.info("Successfully enriched RDF with self-analysis")
         except Exception as e:
             logger.warning(f"Failed to enrich with self-analysis: {e}")
 
 
+@lru_cache(maxsize=8)
+def _load_shapes_graph_version(shapes_dir: str, fingerprint: Tuple[tuple, ...]) -> "Graph":
+    """Parse the listed shape files; memoized per directory fingerprint.
+
+    Args:
+        shapes_dir: Directory containing the shape files
+        fingerprint: Sorted (name, mtime_ns, size) of each shape file
+
+    Returns:
+        RDFLib Graph with all loaded shapes. Shared between callers, so it
+        must not be modified (pyshacl only adds its two idempotent
+        owl:Class/owl:DatatypeProperty subclass axioms on first use).
+    """
+    shapes_graph = Graph()
+
+    for name, _, _ in fingerprint:
+        try:
+            shapes_graph.parse(os.path.join(shapes_dir, name))
+            logger.debug(f"Loaded SHACL shape: {name}")
+        except Exception as e:
+            logger.warning(f"Failed to parse shape file {name}: {e}")
+
+    return shapes_graph
+
+
 def _load_shapes_graph(shapes_dir: str) -> "Graph":
     """Load SHACL shapes from directory into RDF graph.
-    
+
+    Shapes are parsed once and reused until a shape file is added, removed
+    or modified.
+
     Args:
         shapes_dir: Directory containing .ttl/.rdf/.nt shape files
-        
+
     Returns:
-        RDFLib Graph with all loaded shapes
-        
+        RDFLib Graph with all loaded shapes (shared; do not modify)
+
     Raises:
         OSError: If shapes directory cannot be read
     """
-    from rdflib import Graph
-    import os
-    
-    shapes_graph = Graph()
-    
-    for fn in os.listdir(shapes_dir):
-        if fn.endswith(".ttl") or fn.endswith(".rdf") or fn.endswith(".nt"):
-            shape_path = os.path.join(shapes_dir, fn)
-            try:
-                shapes_graph.parse(shape_path)
-                logger.debug(f"Loaded SHACL shape: {fn}")
-            except Exception as e:
-                logger.warning(f"Failed to parse shape file {fn}: {e}")
-    
-    return shapes_graph
+    # scandir reports file types without extra stat calls; sort for a stable load order
+    with os.scandir(shapes_dir) as it:
+        entries = [
+            entry
+            for entry in it
+            if entry.name.rpartition(".")[2] in _SHAPE_SUFFIXES and entry.is_file()
+        ]
+
+    fingerprint = tuple(sorted((e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in entries))
+    return _load_shapes_graph_version(shapes_dir, fingerprint)
+
+
+def _needs_rdfs_inference(data_graph: "Graph") -> bool:
+    """Check whether RDFS inference could change SHACL results for a graph.
+
+    Args:
+        data_graph: RDFLib Graph that will be validated
+
+    Returns:
+        True if the graph holds subClassOf/subPropertyOf/domain/range triples
+    """
+    return any((None, predicate, None) in data_graph for predicate in _RDFS_SCHEMA_PREDICATES)
 
 
 def _extract_violations(report_graph: "Graph") -> list[dict]:
@@ -169,34 +245,82 @@ def _extract_violations(report_graph: "Graph") -> list[dict]:
         List of violation dicts with focusNode, message, severity, value
     """
     violations = []
-    
-    query = """
-    PREFIX sh: <http://www.w3.org/ns/shacl#>
-    SELECT ?focusNode ?message ?severity ?value WHERE {
-        ?result a sh:ValidationResult .
-        ?result sh:focusNode ?focusNode .
-        ?result sh:resultMessage ?message .
-        ?result sh:resultSeverity ?severity .
-        OPTIONAL { ?result sh:value ?value }
-    }
-    """
-    
+
+    # Plain triple lookups: the SPARQL equivalent pays for query parsing and
+    # algebra on every report. product() keeps its join semantics (one entry
+    # per focusNode/message/severity/value combination, value optional).
     try:
-        for row in report_graph.query(query):
-            violations.append(
-                {
-                    "focusNode": str(row.focusNode),
-                    "message": str(row.message),
-                    "severity": str(row.severity).split("#")[-1],  # Extract "Violation", "Warning", etc.
-                    "value": str(row.value) if row.value else None,
-                }
+        for result in report_graph.subjects(RDF.type, _SH_VALIDATION_RESULT, unique=True):
+            values: List[Optional[Node]] = [*report_graph.objects(result, _SH_VALUE)] or [None]
+            rows = itertools.product(
+                report_graph.objects(result, _SH_FOCUS_NODE),
+                report_graph.objects(result, _SH_RESULT_MESSAGE),
+                report_graph.objects(result, _SH_RESULT_SEVERITY),
+                values,
             )
+            for focus_node, message, severity, value in rows:
+                violations.append(
+                    {
+                        "focusNode": str(focus_node),
+                        "message": str(message),
+                        "severity": str(severity).split("#")[-1],  # "Violation", "Warning", ...
+                        "value": str(value) if value else None,
+                    }
+                )
     except Exception as e:
         logger.warning(f"Failed to extract violations: {e}")
-    
+
     return violations
 
 
+def _stream_turtle(graph: "Graph", path: str) -> None:
+    """Write graph as Turtle one subject block at a time.
+
+    Unlike rdflib's Turtle serializer, nothing is pretty-printed or nested:
+    every subject (blank nodes included) gets its own block with sorted
+    predicate/object pairs, so only one block is ever held as text. A first
+    pass over the graph resolves prefixed names, so the header declares only
+    the prefixes that are actually used.
+
+    Args:
+        graph: RDFLib Graph to serialize
+        path: Output file path
+    """
+    prefixes = {str(namespace): prefix for prefix, namespace in graph.namespaces()}
+    names: dict = {}
+    used: set = set()
+
+    def term(node) -> str:
+        if isinstance(node, URIRef):
+            name = names.get(node)
+            if name is None:
+                namespace, sep, local = node.rpartition("#" if "#" in node else "/")
+                prefix = prefixes.get(namespace + sep)
+                if prefix is not None and (not local or _PN_LOCAL_RE.fullmatch(local)):
+                    name = f"{prefix}:{local}"
+                    used.add(prefix)
+                else:
+                    name = node.n3()
+                names[node] = name
+            return name
+        if isinstance(node, Literal) and node.datatype is not None:
+            return f"{Literal(str(node)).n3()}^^{term(node.datatype)}"
+        return node.n3()
+
+    for triple in graph:
+        for node in triple:
+            term(node)
+
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for prefix, namespace in sorted(graph.namespaces()):
+            if prefix in used:
+                f.write(f"@prefix {prefix}: <{namespace}> .\n")
+        for subject in sorted(cast(Set[IdentifiedNode], set(graph.subjects()))):
+            pairs = sorted(graph.predicate_objects(subject))
+            body = " ;\n    ".join(f"{term(p)} {term(o)}" for p, o in pairs)
+            f.write(f"\n{term(subject)} {body} .\n")
+
+
 def _enrich_graph_with_meta_ontologies(graph, project: Project) -> None:
     """Enrich RDF graph with meta-loop ontology triples.
 
@@ -210,87 +334,74 @@ def _enrich_graph_with_meta_ontologies(graph, project: Project) -> None:
         graph: RDFLib Graph to enrich
         project: Project model with analysis data
     """
-    try:
-        from rdflib import Literal, Namespace, URIRef
-        from rdflib.namespace import RDF, XSD
-
-        META = Namespace(META_NS)
-        TEST = Namespace(TEST_NS)
-        QUALITY = Namespace(QUALITY_NS)
-        DOCS = Namespace(DOCS_NS)
+    if not _HAS_RDFLIB:
+        logger.warning("rdflib not available, skipping meta-ontology enrichment")
+        return
 
+    try:
         # Bind namespaces
-        graph.bind("meta", META)
-        graph.bind("test", TEST)
-        graph.bind("quality", QUALITY)
-        graph.bind("docs", DOCS)
-
-        # Add SelfAnalysis node
-        from datetime import datetime, timezone
+        graph.bind("meta", _META)
+        graph.bind("test", _TEST)
+        graph.bind("quality", _QUALITY)
+        graph.bind("docs", _DOCS)
 
+        # Collect every triple first and add them in one batched addN call
         analysis_uri = URIRef(f"{project.id}/meta/self_analysis")
-        graph.add((analysis_uri, RDF.type, META.SelfAnalysis))
-        graph.add(
-            (analysis_uri, META.stratificationLevel, Literal(0, datatype=XSD.nonNegativeInteger))
-        )
-        graph.add((analysis_uri, META.readOnlyMode, Literal(True, datatype=XSD.boolean)))
-        graph.add(
+        triples = [
+            (analysis_uri, RDF.type, _META.SelfAnalysis),
+            (analysis_uri, _META.stratificationLevel, _LIT_LEVEL_ZERO),
+            (analysis_uri, _META.readOnlyMode, _LIT_TRUE),
             (
                 analysis_uri,
-                META.performedAt,
+                _META.performedAt,
                 Literal(datetime.now(timezone.utc).isoformat(), datatype=XSD.dateTime),
-            )
-        )
-        graph.add((analysis_uri, META.safetyChecksPassed, Literal(True, datatype=XSD.boolean)))
-        graph.add((analysis_uri, META.analyzedProject, URIRef(project.id)))
+            ),
+            (analysis_uri, _META.safetyChecksPassed, _LIT_TRUE),
+            (analysis_uri, _META.analyzedProject, URIRef(project.id)),
+        ]
+
+        # Aggregate complexity and documented files in a single pass over the files
+        total_files = len(project.files)
+        total_complexity = 0.0
+        files_with_docs = 0
+        for f in project.files.values():
+            total_complexity += f.complexity or 0
+            if f.lines_of_code and f.lines_of_code > 0:
+                files_with_docs += 1
 
         # Add quality gate for complexity
-        if project.files:
-            avg_complexity = sum(f.complexity or 0 for f in project.files.values()) / len(
-                project.files
-            )
+        if total_files:
+            avg_complexity = total_complexity / total_files
             gate_uri = URIRef(f"{project.id}/quality/complexity_gate")
-            graph.add((gate_uri, RDF.type, QUALITY.ComplexityGate))
-            graph.add((gate_uri, QUALITY.threshold, Literal(15.0, datatype=XSD.decimal)))
-            graph.add(
-                (gate_uri, QUALITY.actualValue, Literal(avg_complexity, datatype=XSD.decimal))
+            triples.append((gate_uri, RDF.type, _QUALITY.ComplexityGate))
+            triples.append((gate_uri, _QUALITY.threshold, _LIT_COMPLEXITY_THRESHOLD))
+            triples.append(
+                (gate_uri, _QUALITY.actualValue, Literal(avg_complexity, datatype=XSD.decimal))
             )
 
             if avg_complexity <= 15.0:
-                graph.add((gate_uri, QUALITY.gateStatus, Literal("passed")))
+                triples.append((gate_uri, _QUALITY.gateStatus, _LIT_PASSED))
             else:
-                graph.add((gate_uri, QUALITY.gateStatus, Literal("failed")))
-                graph.add(
-                    (gate_uri, QUALITY.blocksMerge, Literal(False, datatype=XSD.boolean))
-                )  # Warning only
+                triples.append((gate_uri, _QUALITY.gateStatus, _LIT_FAILED))
+                triples.append((gate_uri, _QUALITY.blocksMerge, _LIT_FALSE))  # Warning only
 
         # Add test coverage info (if available)
         # TODO: Integrate with actual test coverage data from pytest
 
         # Add documentation coverage (placeholder)
-        from decimal import Decimal
-
         doc_coverage_uri = URIRef(f"{project.id}/docs/coverage")
-        graph.add((doc_coverage_uri, RDF.type, DOCS.Coverage))
-        # Count files with docstrings vs total
-        files_with_docs = sum(
-            1 for f in project.files.values() if f.lines_of_code and f.lines_of_code > 0
-        )
-        total_files = len(project.files)
-        doc_percentage = Decimal((files_with_docs / total_files * 100) if total_files > 0 else 0.0)
-        # Ensure decimal datatype is explicit
-        graph.add(
-            (
-                doc_coverage_uri,
-                DOCS.coveragePercentage,
-                Literal(doc_percentage, datatype=XSD.decimal),
-            )
-        )
+        triples.append((doc_coverage_uri, RDF.type, _DOCS.Coverage))
+        # Share of files with docstrings (counted above), in exact decimal arithmetic
+        if total_files:
+            doc_percentage = Decimal(files_with_docs * 100) / total_files
+            coverage_literal = Literal(doc_percentage, datatype=XSD.decimal)
+        else:
+            coverage_literal = _LIT_ZERO_PERCENT
+        triples.append((doc_coverage_uri, _DOCS.coveragePercentage, coverage_literal))
 
+        graph.addN((s, p, o, graph) for s, p, o in triples)
         logger.debug(f"Enriched graph with meta-ontology triples for {project.id}")
 
-    except ImportError:
-        logger.warning("rdflib not available, skipping meta-ontology enrichment")
     except Exception as e:
         logger.warning(f"Failed to enrich graph with meta-ontologies: {e}")
 
@@ -310,10 +421,13 @@ def export_ttl(
     min_delta_q: float = 3.0,
     stratification_level: int = 1,
     analyzed_commit: Optional[str] = None,
+    streaming: bool = False,
 ) -> None:
     """Export Project to RDF Turtle format.
 
     Converts project to JSON-LD, then serializes to Turtle using rdflib.
+    With ``streaming=True`` the Turtle is written one subject block at a time
+    instead, which is faster and lighter on large graphs but not pretty-printed.
 
     Args:
         project: Project model to export
@@ -330,6 +444,8 @@ def export_ttl(
         min_delta_q: Minimum ΔQ threshold for recommendations (default: 3.0)
         stratification_level: Stratification level for self-analysis (default: 1, max: 2)
         analyzed_commit: Git commit SHA being analyzed
+        streaming: If True, write flat per-subject Turtle blocks instead of
+            rdflib's pretty-printed output (default: False)
 
     Raises:
         RuntimeError: If rdflib is not installed
@@ -339,72 +455,30 @@ def export_ttl(
         >>> project = Project(id="repo:test", name="Test")
         >>> export_ttl(project, "output/analysis.ttl")
     """
-    try:
-        from rdflib import Graph
-    except ImportError as e:
-        raise RuntimeError("rdflib is required for TTL export (pip install repoq[full])") from e
-    except Exception as e:
-        logger.error(f"Failed to import rdflib: {e}")
-        raise RuntimeError("rdflib import failed") from e
+    if not _HAS_RDFLIB:
+        raise RuntimeError("rdflib is required for TTL export (pip install repoq[full])")
 
     try:
-        g = Graph()
-        data = to_jsonld(project, context_file=context_file, field33_context=field33_context)
-
-        # Canonicalize JSON-LD for deterministic output
-        canonical_data = canonicalize_rdf(data)
-
-        g.parse(data=json.dumps(canonical_data), format="json-ld")
-
-        # Enrich with meta-loop ontologies
-        if enrich_meta:
-            _enrich_graph_with_meta_ontologies(g, project)
-
-        # Enrich with test coverage data
-        if enrich_test_coverage:
-            from .test_coverage import enrich_graph_with_test_coverage
-
-            try:
-                enrich_graph_with_test_coverage(g, project.id, coverage_path)
-                logger.info("Successfully enriched RDF with test coverage data")
-            except Exception as e:
-                logger.warning(f"Failed to enrich with test coverage: {e}")
-
-        # Enrich with TRS rules
-        if enrich_trs_rules:
-            from .trs_rules import enrich_graph_with_trs_rules
-
-            try:
-                enrich_graph_with_trs_rules(g, project.id)
-                logger.info("Successfully enriched RDF with TRS rules")
-            except Exception as e:
-                logger.warning(f"Failed to enrich with TRS rules: {e}")
-
-        # Enrich with quality recommendations
-        if enrich_quality_recommendations:
-            from .quality_recommendations import enrich_graph_with_quality_recommendations
-
-            try:
-                enrich_graph_with_quality_recommendations(
-                    g, project, top_k=top_k_recommendations, min_delta_q=min_delta_q
-                )
-                logger.info("Successfully enriched RDF with quality recommendations")
-            except Exception as e:
-                logger.warning(f"Failed to enrich with quality recommendations: {e}")
-
-        # Enrich with self-analysis validation
-        if enrich_self_analysis:
-            from .meta_validation import enrich_graph_with_self_analysis
-
-            try:
-                enrich_graph_with_self_analysis(
-                    g, project, stratification_level=stratification_level, analyzed_commit=analyzed_commit
-                )
-                logger.info("Successfully enriched RDF with self-analysis validation")
-            except Exception as e:
-                logger.warning(f"Failed to enrich with self-analysis: {e}")
+        g = _build_data_graph(project, context_file, field33_context)
+        _apply_enrichments(
+            g,
+            project,
+            enrich_meta,
+            enrich_test_coverage,
+            enrich_trs_rules,
+            enrich_quality_recommendations,
+            enrich_self_analysis,
+            coverage_path,
+            top_k_recommendations,
+            min_delta_q,
+            stratification_level,
+            analyzed_commit,
+        )
 
-        g.serialize(destination=ttl_path, format="turtle")
+        if streaming:
+            _stream_turtle(g, ttl_path)
+        else:
+            g.serialize(destination=ttl_path, format="turtle")
         logger.info(f"Successfully exported canonical RDF Turtle to {ttl_path}")
     except OSError as e:
         logger.error(f"Failed to write Turtle file {ttl_path}: {e}")
@@ -429,11 +503,14 @@ def validate_shapes(
     min_delta_q: float = 3.0,
     stratification_level: int = 1,
     analyzed_commit: Optional[str] = None,
+    inference: Optional[str] = None,
 ) -> dict:
     """Validate Project RDF data against SHACL shapes.
 
     Converts project to RDF, loads SHACL shapes from directory, and validates.
     Includes meta-loop ontology validation (stratification, gates, etc.).
+    By default RDFS inference runs only when the data graph contains RDFS
+    schema triples; without them it would only add axiomatic triples.
 
     Args:
         project: Project model to validate
@@ -450,6 +527,8 @@ def validate_shapes(
         min_delta_q: Minimum ΔQ threshold for recommendations (default: 3.0)
         stratification_level: Stratification level for self-analysis (default: 1, max: 2)
         analyzed_commit: Git commit SHA being analyzed
+        inference: pyshacl inference mode ("rdfs", "none", ...). Defaults to
+            "rdfs" when the data graph has RDFS schema triples, else "none"
 
     Returns:
         Dictionary with keys:
@@ -468,9 +547,11 @@ def validate_shapes(
         ...     for v in result['violations']:
         ...         print(f"  - {v['message']}")
     """
+    if not _HAS_RDFLIB:
+        raise RuntimeError("pyshacl and rdflib required for validation (pip install repoq[full])")
     try:
+        # Deferred: pyshacl is only needed for validation and is slow to import
         from pyshacl import validate
-        from rdflib import Graph
     except ImportError as e:
         raise RuntimeError(
             "pyshacl and rdflib required for validation (pip install repoq[full])"
@@ -503,9 +584,10 @@ def validate_shapes(
         shapes_graph = _load_shapes_graph(shapes_dir)
         
         # Perform validation
-        from pyshacl import validate
+        if inference is None:
+            inference = "rdfs" if _needs_rdfs_inference(data_graph) else "none"
         conforms, report_graph, report_text = validate(
-            data_graph, shacl_graph=shapes_graph, inference="rdfs", debug=False
+            data_graph, shacl_graph=shapes_graph, inference=inference, debug=False
         )
         
         # Extract violations if any
@@ -189,38 +189,36 @@ def export_test_coverage_rdf(
     # Add namespace binding
     graph.bind("test", TEST)
 
-    # 1. Export overall coverage
+    # 1. Export overall coverage (triples are collected and added in one addN call)
     coverage_uri = URIRef(f"{project_id}/test/coverage")
-    graph.add((coverage_uri, RDF.type, TEST.Coverage))
-    graph.add(
+    triples = [
+        (coverage_uri, RDF.type, TEST.Coverage),
         (
             coverage_uri,
             TEST.coveragePercentage,
             Literal(coverage.coverage_percentage, datatype=XSD.decimal),
-        )
-    )
-    graph.add(
-        (coverage_uri, TEST.coveredLines, Literal(coverage.covered_lines, datatype=XSD.integer))
-    )
-    graph.add(
-        (coverage_uri, TEST.totalLines, Literal(coverage.total_lines, datatype=XSD.integer))
-    )
+        ),
+        (coverage_uri, TEST.coveredLines, Literal(coverage.covered_lines, datatype=XSD.integer)),
+        (coverage_uri, TEST.totalLines, Literal(coverage.total_lines, datatype=XSD.integer)),
+    ]
 
     # 2. Export test cases
     for test in tests:
         test_uri = URIRef(test.id)
-        graph.add((test_uri, RDF.type, TEST.TestCase))
-        graph.add((test_uri, TEST.testName, Literal(test.name)))
-        graph.add((test_uri, TEST.testFilePath, Literal(test.file_path)))
+        triples.append((test_uri, RDF.type, TEST.TestCase))
+        triples.append((test_uri, TEST.testName, Literal(test.name)))
+        triples.append((test_uri, TEST.testFilePath, Literal(test.file_path)))
 
         if test.test_class:
-            graph.add((test_uri, TEST.testClass, Literal(test.test_class)))
+            triples.append((test_uri, TEST.testClass, Literal(test.test_class)))
 
         if test.tested_concept:
             # Link to tested concept (generic string for now)
-            graph.add((test_uri, TEST.testedConcept, Literal(test.tested_concept)))
+            triples.append((test_uri, TEST.testedConcept, Literal(test.tested_concept)))
+
+        triples.append((test_uri, TEST.testStatus, Literal(test.status)))
 
-        graph.add((test_uri, TEST.testStatus, Literal(test.status)))
+    graph.addN((s, p, o, graph) for s, p, o in triples)
 
 
 def enrich_graph_with_test_coverage(
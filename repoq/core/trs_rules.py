@@ -261,35 +261,38 @@ def export_trs_systems_rdf(graph: Graph, systems: List[TRSSystem], project_id: s
     # Add namespace binding
     graph.bind("trs", TRS)
 
+    # Collect every triple first and add them in one batched addN call
+    true_literal = Literal(True, datatype=XSD.boolean)
+    triples = []
     for system in systems:
         # Create TRS system instance
         system_uri = URIRef(f"{project_id}/{system.id}")
-        graph.add((system_uri, RDF.type, TRS.RewriteSystem))
-        graph.add((system_uri, TRS.systemName, Literal(system.name)))
+        triples.append((system_uri, RDF.type, TRS.RewriteSystem))
+        triples.append((system_uri, TRS.systemName, Literal(system.name)))
 
         # Add verification metadata
-        graph.add(
+        triples.append(
             (
                 system_uri,
                 TRS.confluenceProven,
                 Literal(system.confluence_proven, datatype=XSD.boolean),
             )
         )
-        graph.add(
+        triples.append(
             (
                 system_uri,
                 TRS.terminationProven,
                 Literal(system.termination_proven, datatype=XSD.boolean),
             )
         )
-        graph.add(
+        triples.append(
             (
                 system_uri,
                 TRS.soundnessProven,
                 Literal(system.termination_proven, datatype=XSD.boolean),  # Soundness = termination for now
             )
         )
-        graph.add(
+        triples.append(
             (
                 system_uri,
                 TRS.criticalPairsCount,
@@ -300,28 +303,22 @@ def export_trs_systems_rdf(graph: Graph, systems: List[TRSSystem], project_id: s
         # Add rules
         for rule in system.rules:
             rule_uri = URIRef(rule.id)
-            graph.add((rule_uri, RDF.type, TRS.Rule))
-            graph.add((rule_uri, TRS.ruleName, Literal(rule.name)))
-            graph.add((rule_uri, TRS.leftHandSide, Literal(rule.left_hand_side)))
-            graph.add((rule_uri, TRS.rightHandSide, Literal(rule.right_hand_side)))
-            graph.add((rule_uri, TRS.inSystem, system_uri))
+            triples.append((rule_uri, RDF.type, TRS.Rule))
+            triples.append((rule_uri, TRS.ruleName, Literal(rule.name)))
+            triples.append((rule_uri, TRS.leftHandSide, Literal(rule.left_hand_side)))
+            triples.append((rule_uri, TRS.rightHandSide, Literal(rule.right_hand_side)))
+            triples.append((rule_uri, TRS.inSystem, system_uri))
 
             if rule.description:
-                graph.add((rule_uri, TRS.ruleDescription, Literal(rule.description)))
+                triples.append((rule_uri, TRS.ruleDescription, Literal(rule.description)))
 
             if rule.termination_proven:
-                graph.add(
-                    (
-                        rule_uri,
-                        TRS.terminationProven,
-                        Literal(True, datatype=XSD.boolean),
-                    )
-                )
+                triples.append((rule_uri, TRS.terminationProven, true_literal))
 
             if rule.soundness_proven:
-                graph.add(
-                    (rule_uri, TRS.soundnessProven, Literal(True, datatype=XSD.boolean))
-                )
+                triples.append((rule_uri, TRS.soundnessProven, true_literal))
+
+    graph.addN((s, p, o, graph) for s, p, o in triples)
 
 
 def enrich_graph_with_trs_rules(
@@ -33,7 +33,6 @@ Confluence:
 import hashlib
 import json
 import logging
-from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
@@ -326,13 +325,10 @@ def _canonicalize_blank_nodes(graph: RDFGraph) -> RDFGraph:
 def _canonicalize_jsonld_object(obj: Any) -> Any:
     """Canonicalize JSON-LD object by sorting properties and arrays."""
     if isinstance(obj, dict):
-        # Sort properties alphabetically
-        sorted_obj = OrderedDict()
-        for key in sorted(obj.keys()):
-            sorted_obj[key] = _canonicalize_jsonld_object(obj[key])
-        return sorted_obj
+        # Sort properties alphabetically (plain dicts keep insertion order)
+        return {key: _canonicalize_jsonld_object(obj[key]) for key in sorted(obj)}
 
-    elif isinstance(obj, list):
+    elif isinstance(obj, (list, tuple)):
         # Sort arrays if they contain objects with @id
         if obj and isinstance(obj[0], dict) and "@id" in obj[0]:
             # Sort by @id for deterministic ordering
@@ -505,24 +505,34 @@ def assign_priority(delta_q: float, complexity: float) -> str:
         return "low"
 
 
-def _load_and_filter_files(
-    jsonld_path: Path,
-    min_delta_q: float,
-) -> tuple[list[dict], list[dict]]:
-    """Load JSON-LD data and filter files by minimum ΔQ.
+def _load_jsonld(jsonld_path: Path) -> dict:
+    """Load JSON-LD quality analysis data from disk.
 
     Args:
         jsonld_path: Path to JSON-LD quality analysis file
-        min_delta_q: Minimum ΔQ threshold for inclusion
 
     Returns:
-        Tuple of (filtered file scores, all files for baseline calculation)
+        Parsed JSON-LD document
     """
     if not jsonld_path.exists():
         raise FileNotFoundError(f"JSON-LD file not found: {jsonld_path}")
 
-    data = json.loads(jsonld_path.read_text(encoding="utf-8"))
+    return json.loads(jsonld_path.read_text(encoding="utf-8"))
+
+
+def _filter_files(
+    data: dict,
+    min_delta_q: float,
+) -> tuple[list[dict], list[dict]]:
+    """Filter the files of JSON-LD data by minimum ΔQ.
+
+    Args:
+        data: Parsed JSON-LD quality analysis document
+        min_delta_q: Minimum ΔQ threshold for inclusion
 
+    Returns:
+        Tuple of (filtered file scores, all files for baseline calculation)
+    """
     # Extract files
     files = data.get("files", [])
     if not isinstance(files, list):
@@ -652,10 +662,30 @@ def generate_refactoring_plan(
         6. Generate recommendations and estimate effort
         7. Assign priorities
     """
-    jsonld_path = Path(jsonld_path)
+    data = _load_jsonld(Path(jsonld_path))
+    return generate_refactoring_plan_from_data(data, top_k=top_k, min_delta_q=min_delta_q)
 
-    # Load and filter files by ΔQ threshold
-    file_scores, all_files = _load_and_filter_files(jsonld_path, min_delta_q)
+
+def generate_refactoring_plan_from_data(
+    data: dict,
+    top_k: int = 10,
+    min_delta_q: float = 3.0,
+) -> RefactoringPlan:
+    """Generate refactoring plan from already-parsed JSON-LD analysis data.
+
+    Lets in-process callers (e.g. the output of to_jsonld) skip writing and
+    re-reading a JSON-LD file.
+
+    Args:
+        data: JSON-LD quality analysis document (only its "files" are used)
+        top_k: Maximum number of tasks to generate (greedy selection)
+        min_delta_q: Minimum ΔQ threshold for inclusion
+
+    Returns:
+        Complete refactoring plan with prioritized tasks
+    """
+    # Filter files by ΔQ threshold
+    file_scores, all_files = _filter_files(data, min_delta_q)
 
     # Sort by ΔQ descending (greedy selection) and select top-k
     file_scores.sort(key=lambda x: x["delta_q"], reverse=True)
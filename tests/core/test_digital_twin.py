@@ -8,12 +8,19 @@ Test Coverage:
 - Snapshot export
 """
 
+import io
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
-from rdflib import RDF, Graph, Namespace, URIRef
+from rdflib import RDF, Graph, Literal, Namespace, URIRef
 
-from repoq.core.digital_twin import DigitalTwin
+from repoq.core.digital_twin import (
+    DigitalTwin,
+    _count_lines,
+    _parse_git_log_changes,
+    _write_ntriples,
+)
 
 REPO = Namespace("https://repoq.dev/ontology/repo#")
 STORY_OLD = Namespace("https://repoq.io/story#")  # Legacy namespace (phase1.ttl)
@@ -45,6 +52,72 @@ class TestDigitalTwinInitialization:
         with pytest.raises(ValueError, match="Workspace root does not exist"):
             DigitalTwin(workspace_root=Path("/nonexistent/path"))
 
+    def test_file_uri_cache_is_thread_safe(self):
+        """Concurrent lookups and invalidation should agree on one URIRef per path."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        dt = DigitalTwin()
+        paths = [f"pkg/mod{i}.py" for i in range(200)]
+
+        def lookup(_: int) -> list[URIRef]:
+            dt.invalidate()
+            return [dt._file_uri(p) for p in paths]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lookup, range(8)))
+
+        assert all(r == results[0] for r in results)
+        assert all(dt._file_uri(p) is dt._file_uri(p) for p in paths)
+
+    def test_file_uri_percent_encodes_unsafe_characters(self):
+        """Paths with spaces or brackets should give IRIs every graph store accepts."""
+        from repoq.core.digital_twin import _new_graph
+
+        dt = DigitalTwin()
+        uri = dt._file_uri("docs/my notes[1].py")
+
+        assert uri == URIRef("https://repoq.dev/resource/file/docs/my%20notes%5B1%5D.py")
+        graph = _new_graph()
+        graph.add((uri, REPO.filePath, Literal("docs/my notes[1].py")))
+        assert len(graph) == 1
+
+    @staticmethod
+    def _write_static_ttl(tmp_path: Path, count: int) -> Path:
+        story = tmp_path / ".repoq" / "story"
+        story.mkdir(parents=True)
+        for i in range(count):
+            (story / f"s{i}.ttl").write_text(
+                f'@prefix ex: <https://ex.org/> .\nex:s{i} ex:label "story {i}" .\n'
+            )
+        return tmp_path
+
+    def test_parallel_parse_is_opt_in(self, tmp_path, monkeypatch):
+        """Default construction must never start worker processes."""
+        import repoq.core.digital_twin as digital_twin
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("ProcessPoolExecutor started")
+
+        monkeypatch.setattr(digital_twin, "ProcessPoolExecutor", no_pool)
+        workspace = self._write_static_ttl(tmp_path, 16)
+
+        assert len(DigitalTwin(workspace_root=workspace).static_graph) == 16
+        # Opted in, but far below the size threshold
+        assert len(DigitalTwin(workspace_root=workspace, parallel_parse=True).static_graph) == 16
+
+    def test_parallel_parse_matches_serial(self, tmp_path, monkeypatch):
+        """Parallel parsing above the size threshold should load the same triples."""
+        import repoq.core.digital_twin as digital_twin
+
+        workspace = self._write_static_ttl(tmp_path, 4)
+        serial = DigitalTwin(workspace_root=workspace).static_graph
+
+        monkeypatch.setattr(digital_twin, "_PARALLEL_PARSE_MIN_BYTES", 0)
+        monkeypatch.setattr(digital_twin.os, "cpu_count", lambda: 2)
+        parallel = DigitalTwin(workspace_root=workspace, parallel_parse=True).static_graph
+
+        assert set(parallel) == set(serial)
+
     def test_init_no_repoq_directory(self, tmp_path):
         """Should raise ValueError if .repoq directory missing."""
         with pytest.raises(ValueError, match=".repoq directory not found"):
@@ -149,6 +222,61 @@ class TestDigitalTwinDynamicGeneration:
         commits_10 = list(graph_10.subjects(RDF.type, REPO.Commit))
         assert len(commits_10) <= 10  # May have fewer if repo is small
 
+    def test_get_commits_rdf_respects_since(self):
+        """Should only include commits committed at or after `since`."""
+        dt = DigitalTwin()
+        since = datetime.now() + timedelta(days=1)
+
+        graph = dt.get_commits_rdf(since=since)
+
+        assert list(graph.subjects(RDF.type, REPO.Commit)) == []
+
+        graph_all = dt.get_commits_rdf(since=datetime(1970, 1, 2), limit=3)
+        assert len(list(graph_all.subjects(RDF.type, REPO.Commit))) > 0
+
+    def test_get_commits_rdf_path_with_space(self, tmp_path):
+        """Committed paths with spaces should still yield a change node."""
+        import subprocess
+
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        (tmp_path / ".repoq").mkdir()
+        git("init", "-q")
+        git("config", "user.email", "dev@example.org")
+        git("config", "user.name", "Dev")
+        (tmp_path / "README.md").write_text("readme\n")
+        git("add", "README.md")
+        git("commit", "-q", "-m", "Initial")
+        (tmp_path / "my notes.py").write_text("x = 1\n")
+        git("add", "my notes.py")
+        git("commit", "-q", "-m", "Add notes")
+
+        graph = DigitalTwin(workspace_root=tmp_path).get_commits_rdf()
+
+        changes = list(graph.subjects(RDF.type, REPO.Addition))
+        assert len(changes) == 1
+        assert str(changes[0]).endswith("_my%20notes.py")
+        file_uri = URIRef("https://repoq.dev/resource/file/my%20notes.py")
+        assert graph.value(changes[0], REPO.changesFile) == file_uri
+
+    def test_parse_git_log_changes_pairs_raw_and_numstat(self):
+        """Should pair --raw statuses with --numstat counts, incl. renames and binaries."""
+        diff = (
+            "\n:100644 100644 aaa bbb M\0b\0"
+            ":100644 100644 ccc ccc R100\0a\0c\0"
+            ":000000 100644 000 ddd A\0img.png\0"
+            "1\t2\tb\0"
+            "0\t0\t\0a\0c\0"
+            "-\t-\timg.png\0"
+        )
+
+        assert _parse_git_log_changes(diff) == [
+            ("M", "b", "b", 1, 2),
+            ("R", "a", "c", 0, 0),
+            ("A", "img.png", "img.png", None, None),
+        ]
+
     def test_get_files_rdf_empty(self):
         """Should return empty graph (not implemented yet)."""
         dt = DigitalTwin()
@@ -219,6 +347,18 @@ class TestDigitalTwinDynamicGeneration:
             assert "tests" not in path_str, f"Found test file: {path_str}"
             assert ".venv" not in path_str, f"Found .venv file: {path_str}"
 
+    def test_get_files_rdf_lines_of_code_matches_readlines(self):
+        """linesOfCode should equal len(readlines()), including a final unterminated line."""
+        dt = DigitalTwin()
+        graph = dt.get_files_rdf(extensions=[".toml"])
+
+        file_uri = URIRef("https://repoq.dev/resource/file/pyproject.toml")
+        loc = list(graph.objects(file_uri, REPO.linesOfCode))
+        assert len(loc) == 1
+
+        with open(Path.cwd() / "pyproject.toml", encoding="utf-8") as f:
+            assert int(loc[0]) == len(f.readlines())
+
     def test_get_tests_rdf_returns_graph(self):
         """Should return Graph with tests."""
         dt = DigitalTwin()
@@ -421,3 +561,44 @@ class TestDigitalTwinCompleteGraph:
 
         assert output.exists()
         assert output.parent.exists()
+
+    def test_export_snapshot_streams_ntriples(self, tmp_path):
+        """N-Triples export should be streamed and contain commits, files and static data."""
+        dt = DigitalTwin()
+        output = tmp_path / "snapshot.nt"
+
+        dt.export_snapshot(output, format="nt")
+
+        g = Graph()
+        g.parse(output, format="nt")
+        assert len(list(g.subjects(RDF.type, REPO.Commit))) > 0
+        assert len(list(g.subjects(RDF.type, REPO.PythonFile))) > 0
+        assert len(g) >= len(dt.static_graph)
+
+    def test_ntriples_escapes_iris_with_spaces(self):
+        """File paths with spaces must still produce valid, round-tripping N-Triples."""
+        file_uri = URIRef("https://repoq.dev/resource/file/docs/my notes<1>.py")
+        buf = io.StringIO()
+
+        _write_ntriples(buf, [(file_uri, REPO.filePath, Literal("docs/my notes<1>.py"))])
+
+        assert " notes" not in buf.getvalue().split('"')[0]
+        g = Graph()
+        g.parse(data=buf.getvalue(), format="nt")
+        assert g.value(file_uri, REPO.filePath) == Literal("docs/my notes<1>.py")
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"a", b"a\n", b"a\nb", b"a\r\nb\r\n", b"a\rb\rc", b"a\r\r\n\n", b"\r\n" * 5],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 1 << 20])
+def test_count_lines_matches_text_mode(tmp_path, content, chunk_size):
+    """Byte-level line counting should agree with universal-newline readlines()."""
+    path = tmp_path / "f.py"
+    path.write_bytes(content)
+
+    with open(path, encoding="utf-8") as f:
+        expected = len(f.readlines())
+
+    assert _count_lines(str(path), chunk_size=chunk_size) == expected
@@ -285,6 +285,38 @@ class TestDiffAnalyzer:
         assert len(changed) == 1
         assert "test.py" in changed[0]
 
+    def test_libgit2_matches_git_cli(self, temp_git_repo):
+        """libgit2 fast path should report the same files as the git CLI."""
+        pytest.importorskip("pygit2")
+
+        (temp_git_repo / "test.py").write_text("def bar(): pass\n")
+        (temp_git_repo / "staged.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "staged.py"], cwd=temp_git_repo, check=True)
+        (temp_git_repo / "pkg").mkdir()
+        (temp_git_repo / "pkg" / "untracked.py").write_text("y = 2\n")
+
+        analyzer = DiffAnalyzer(repo_path=temp_git_repo)
+
+        assert analyzer._changed_files_libgit2("HEAD", ".") == analyzer._changed_files_cli(
+            "HEAD", "."
+        )
+
+    def test_get_changed_files_without_pygit2(self, temp_git_repo, monkeypatch):
+        """Without pygit2 installed, changed files should come from the git CLI."""
+        import repoq.core.incremental as incremental
+
+        def no_libgit2(*args):
+            raise AssertionError("libgit2 path used without pygit2")
+
+        monkeypatch.setattr(incremental, "pygit2", None)
+        monkeypatch.setattr(DiffAnalyzer, "_changed_files_libgit2", no_libgit2)
+        (temp_git_repo / "test.py").write_text("def bar(): pass\n")
+        (temp_git_repo / "new.py").write_text("def baz(): pass\n")
+
+        changed = DiffAnalyzer(repo_path=temp_git_repo).get_changed_files("HEAD", ".")
+
+        assert sorted(changed) == ["new.py", "test.py"]
+
 
 class TestIncrementalAnalyzer:
     """Test IncrementalAnalyzer orchestration."""
@@ -391,6 +423,43 @@ class TestIncrementalAnalyzer:
         assert cached.metrics["complexity"] == 10
         assert cached.file_path == file_path
 
+    def test_memoryview_round_trip(self, incremental_analyzer, cache):
+        """memoryview content should filter, store and hit like bytes."""
+        cache.set(
+            file_path="seed.py",
+            file_sha="0" * 64,
+            policy_version="v1.0",
+            metrics={},
+            timestamp="2025-10-22T10:00:00Z",
+        )
+        content = memoryview(b"def foo(): pass\n")
+
+        to_analyze = incremental_analyzer.filter_unchanged_files({"test.py": content})
+        assert to_analyze == {"test.py": content}
+
+        incremental_analyzer.store_metrics("test.py", content, {"complexity": 1})
+
+        assert incremental_analyzer.get_cached_metrics(b"def foo(): pass\n") is not None
+        assert incremental_analyzer.filter_unchanged_files({"test.py": content}) == {}
+
+    def test_filter_unchanged_digests_round_trip(self, incremental_analyzer, cache):
+        """Digests returned by filtering should be accepted by store_metrics."""
+        cache.set(
+            file_path="seed.py",
+            file_sha="0" * 64,
+            policy_version="v1.0",
+            metrics={},
+            timestamp="2025-10-22T10:00:00Z",
+        )
+        content = b"def foo(): pass\n"
+
+        digests = incremental_analyzer.filter_unchanged_digests({"test.py": content})
+        assert digests == {"test.py": hashlib.sha256(content).hexdigest()}
+
+        incremental_analyzer.store_metrics("test.py", content, {}, file_sha=digests["test.py"])
+
+        assert incremental_analyzer.filter_unchanged_digests({"test.py": content}) == {}
+
 
 class TestCacheInvalidation:
     """Test cache invalidation scenarios."""
@@ -419,6 +488,45 @@ class TestCacheInvalidation:
         # Should be cache miss with v2.0
         assert analyzer_v2.get_cached_metrics(file_content) is None
 
+    def test_has_entries_tracks_versions(self):
+        """has_entries prefilter should follow set, eviction and invalidation."""
+        cache = MetricCache(max_size=1)
+        assert cache.has_entries("v1.0") is False
+
+        for sha, policy in (("a" * 64, "v1.0"), ("b" * 64, "v2.0")):
+            cache.set(
+                file_path="test.py",
+                file_sha=sha,
+                policy_version=policy,
+                metrics={},
+                timestamp="2025-10-22T10:00:00Z",
+            )
+
+        # v1.0 entry was evicted by the v2.0 one (max_size=1)
+        assert cache.has_entries("v1.0") is False
+        assert cache.has_entries("v2.0") is True
+
+        cache.invalidate("v2.0")
+        assert cache.has_entries("v2.0") is False
+
+    def test_hit_rate_counts_lookups(self, cache):
+        """hit_rate should reflect get() hits/misses and reset on request."""
+        assert cache.hit_rate() == 0.0
+        cache.set(
+            file_path="test.py",
+            file_sha="a" * 64,
+            policy_version="v1.0",
+            metrics={},
+            timestamp="2025-10-22T10:00:00Z",
+        )
+
+        assert cache.get("a" * 64, "v1.0") is not None
+        assert cache.get("a" * 64, "v1.0") is not None
+        assert cache.get("b" * 64, "v1.0") is None
+
+        assert cache.hit_rate(reset=True) == pytest.approx(2 / 3)
+        assert cache.hit_rate() == 0.0
+
     def test_whitespace_only_change_cache_miss(self, incremental_analyzer, cache):
         """Whitespace change should cause cache miss (before normalization)."""
         original = b"def foo():pass\n"
@@ -136,6 +136,19 @@ class TestHistoryAnalyzerIntegration:
         assert len(project.commits) > 0, "Should have at least one commit"
         assert len(project.files) > 0, "Should have at least one file"
 
+    def test_commit_header_shares_person_id(self):
+        """Commits by the same author should reference one interned person ID."""
+        project = Project(id="test:1", name="test-repo")
+        analyzer = HistoryAnalyzer()
+
+        for sha in ("a1", "b2"):
+            analyzer._parse_commit_header(project, f"{sha}\t2024-01-01\tAda\tada@x.org\tmsg")
+
+        first, second = project.commits
+        assert first.author_id == second.author_id
+        assert first.author_id is second.author_id
+        assert project.versions[1].committer is first.author_id
+
 
 @pytest.mark.integration
 class TestHotspotsAnalyzerIntegration:
@@ -221,6 +221,26 @@ def test_shacl_validation_with_meta_ontologies(sample_project, tmp_path):
         pytest.skip("pyshacl not installed")
 
 
+def test_streaming_ttl_matches_rdflib_serializer(sample_project, tmp_path):
+    """Streaming Turtle output should parse back to the same graph."""
+    from rdflib import Graph
+    from rdflib.compare import isomorphic
+
+    from repoq.core.rdf_export import export_ttl
+
+    sample_project.description = 'Multi-line "quoted"\ndescription'
+    pretty_path = tmp_path / "pretty.ttl"
+    stream_path = tmp_path / "stream.ttl"
+
+    export_ttl(sample_project, str(pretty_path), enrich_meta=False)
+    export_ttl(sample_project, str(stream_path), enrich_meta=False, streaming=True)
+
+    pretty = Graph().parse(str(pretty_path), format="turtle")
+    streamed = Graph().parse(str(stream_path), format="turtle")
+    assert len(streamed) > 0
+    assert isomorphic(pretty, streamed)
+
+
 # Define namespace constants for assertions
 META_NS = "http://example.org/vocab/meta#"
 QUALITY_NS = "http://example.org/vocab/quality#"
@@ -120,6 +120,48 @@ def test_workflow_validation_report_format(sample_project, tmp_path):
     print(f"✅ Report format valid: {report_path}")
 
 
+def test_shapes_graph_cached_until_files_change(tmp_path):
+    """Shapes are parsed once and re-read after a shape file changes."""
+    import os
+
+    from repoq.core.rdf_export import _load_shapes_graph
+
+    shape = tmp_path / "a.ttl"
+    shape.write_text("<urn:s> <urn:p> <urn:o> .\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    first = _load_shapes_graph(str(tmp_path))
+    assert _load_shapes_graph(str(tmp_path)) is first
+    assert len(first) == 1
+
+    shape.write_text("<urn:s> <urn:p> <urn:o> , <urn:o2> .\n")
+    stat = shape.stat()
+    os.utime(shape, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = _load_shapes_graph(str(tmp_path))
+    assert second is not first
+    assert len(second) == 2
+
+
+def test_validation_skips_rdfs_inference_without_schema(sample_project):
+    """Auto inference mode should give the same report as forced RDFS inference."""
+    from rdflib import URIRef
+    from rdflib.namespace import RDFS
+
+    from repoq.core.rdf_export import _needs_rdfs_inference
+
+    auto = validate_shapes(sample_project, shapes_dir="repoq/shapes")
+    forced = validate_shapes(sample_project, shapes_dir="repoq/shapes", inference="rdfs")
+
+    assert auto["conforms"] == forced["conforms"]
+    assert len(auto["violations"]) == len(forced["violations"])
+
+    graph = Graph()
+    assert not _needs_rdfs_inference(graph)
+    graph.add((URIRef("urn:a"), RDFS.subClassOf, URIRef("urn:b")))
+    assert _needs_rdfs_inference(graph)
+
+
 def test_workflow_meta_loop_safety(sample_project, tmp_path):
     """Test that meta-loop self-analysis maintains safety guarantees."""
     ttl_path = tmp_path / "repoq_analysis.ttl"
@@ -486,3 +486,11 @@ class TestJSONLDIntegration:
         # Nested properties sorted
         nested_keys = list(canonical["z_property"].keys())
         assert nested_keys == ["nested_a", "nested_z"]
+
+    def test_tuple_arrays_become_lists(self):
+        """Tuple-valued arrays (e.g. shared @type constants) canonicalize to lists."""
+        obj = {"@id": "urn:a", "@type": ("ex:A", "ex:B")}
+
+        canonical = canonicalize_rdf(obj)
+
+        assert canonical["@type"] == ["ex:A", "ex:B"]
@@ -72,6 +72,22 @@ def test_detect_circular_dependencies_simple_cycle():
     assert "repoq.a" in cycles[0] and "repoq.b" in cycles[0]
 
 
+def test_detect_circular_dependencies_deep_chain():
+    """Long import chains must not hit the recursion limit."""
+    project = Project(id="repo:test", name="Test")
+    depth = 5000
+    for i in range(depth):
+        file = File(id=f"repo:test/repoq/m{i}.py", path=f"repoq/m{i}.py")
+        file.dependencies = [f"repoq.m{(i + 1) % depth}"]
+        project.files[file.path] = file
+
+    cycles = detect_circular_dependencies(project)
+
+    assert len(cycles) == 1
+    assert cycles[0].startswith("repoq.m0 → repoq.m1 → ")
+    assert cycles[0].endswith("repoq.m4999 → repoq.m0")
+
+
 def test_check_stratification_consistency_no_violations():
     """Test stratification consistency check with valid levels."""
     project = Project(id="repo:test", name="Test", repository_url="https://github.com/test/test")
@@ -230,3 +230,26 @@ def test_recommendation_sorting_by_delta_q():
     assert recommendations[0].delta_q == Decimal("20.0")
     assert recommendations[1].delta_q == Decimal("10.0")
     assert recommendations[2].delta_q == Decimal("5.0")
+
+
+def test_refactoring_plan_from_data_matches_file(tmp_path):
+    """In-memory JSON-LD should plan exactly like the same document on disk."""
+    import json
+
+    from repoq.core.jsonld import to_jsonld
+    from repoq.refactoring import generate_refactoring_plan, generate_refactoring_plan_from_data
+
+    project = Project(id="repo:test", name="Test")
+    for i, complexity in enumerate((35.0, 12.0, 3.0)):
+        path = f"src/file{i}.py"
+        project.files[path] = File(
+            id=f"repo:test/{path}", path=path, complexity=complexity, lines_of_code=100 * (i + 1)
+        )
+    jsonld_path = tmp_path / "analysis.jsonld"
+    jsonld_path.write_text(json.dumps(to_jsonld(project)))
+
+    from_file = generate_refactoring_plan(jsonld_path, top_k=2)
+    from_data = generate_refactoring_plan_from_data(to_jsonld(project), top_k=2)
+
+    assert [t.to_dict() for t in from_data.tasks] == [t.to_dict() for t in from_file.tasks]
+    assert from_data.projected_q == from_file.projected_q
@@ -96,6 +96,30 @@ class TestCoreModelSmoke:
         assert len(project.files) == 1
         assert project.files["test:file:1"].path == "main.py"
 
+    def test_project_to_dict_matches_asdict(self):
+        """Hand-written to_dict methods should agree with dataclasses.asdict."""
+        from dataclasses import asdict
+
+        from repoq.core.model import Commit, FunctionMetrics, Issue, Person
+
+        project = Project(id="test:1", name="test")
+        project.files["f"] = File(
+            id="f",
+            path="main.py",
+            contributors={"p": {"commits": 1}},
+            functions=[FunctionMetrics("main", 2, 10, 0, 1, 10)],
+        )
+        project.contributors["p"] = Person(id="p", name="P", owns=["f"])
+        project.issues["i"] = Issue(id="i", type="repo:Todo", file_id="f", description="d")
+        project.commits.append(Commit(id="c", message="m", author_id="p", ended_at=None))
+
+        data = project.to_dict()
+
+        assert data["files"]["f"] == asdict(project.files["f"])
+        assert data["contributors"]["p"] == asdict(project.contributors["p"])
+        assert data["issues"]["i"] == asdict(project.issues["i"])
+        assert data["commits"] == [asdict(project.commits[0])]
+
 
 @pytest.mark.smoke
 @pytest.mark.unit
@@ -158,6 +182,126 @@ class TestExportersSmoke:
         # @type is a list in our implementation
         assert "repo:Project" in data["@type"]
 
+    def test_jsonld_custom_context_does_not_leak(self, temp_dir: Path):
+        """Merging a custom context must not alter later exports."""
+        from repoq.core.jsonld import to_jsonld
+
+        project = Project(id="test:1", name="test")
+        context_file = temp_dir / "ctx.jsonld"
+        context_file.write_text(json.dumps({"@context": {"leak": "urn:leak#"}}))
+
+        custom = to_jsonld(project, context_file=str(context_file))
+        default = to_jsonld(project)
+
+        assert custom["@context"]["leak"] == "urn:leak#"
+        assert "leak" not in default["@context"]
+
+    def test_jsonld_context_cache_tracks_file_changes(self, temp_dir: Path):
+        """Cached custom contexts should be re-read once the file changes."""
+        import os
+
+        from repoq.core.jsonld import _cached_context, to_jsonld
+
+        project = Project(id="test:1", name="test")
+        context_file = temp_dir / "ctx.jsonld"
+        context_file.write_text(json.dumps({"@context": {"v": "urn:one#"}}))
+
+        assert _cached_context(str(context_file)) is _cached_context(str(context_file))
+        assert to_jsonld(project, context_file=str(context_file))["@context"]["v"] == "urn:one#"
+
+        context_file.write_text(json.dumps({"@context": {"v": "urn:two#"}}))
+        stat = context_file.stat()
+        os.utime(context_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert to_jsonld(project, context_file=str(context_file))["@context"]["v"] == "urn:two#"
+        with pytest.raises(TypeError):
+            _cached_context(str(context_file))["@context"] = {}
+
+    def test_jsonld_merged_context_is_reused_but_not_shared(self, temp_dir: Path):
+        """Unchanged context files reuse one merge; each export gets its own copy."""
+        from repoq.core.jsonld import _merged_context_version, to_jsonld
+
+        project = Project(id="test:1", name="test")
+        context_file = temp_dir / "ctx.jsonld"
+        context_file.write_text(json.dumps({"@context": {"v": "urn:one#"}}))
+
+        first = to_jsonld(project, context_file=str(context_file))
+        misses = _merged_context_version.cache_info().misses
+        first["@context"]["v"] = "urn:edited#"
+        second = to_jsonld(project, context_file=str(context_file))
+
+        assert _merged_context_version.cache_info().misses == misses
+        assert second["@context"]["v"] == "urn:one#"
+
+    def test_jsonld_nested_values_are_not_shared(self, temp_dir: Path):
+        """Editing nested nodes of one export must not leak into later exports."""
+        from repoq.core.jsonld import to_jsonld
+        from repoq.core.model import Issue
+
+        project = Project(id="test:1", name="test")
+        project.issues["i"] = Issue(
+            id="i", type="repo:Todo", file_id="f", description="d", severity="high"
+        )
+        context_file = temp_dir / "ctx.jsonld"
+        context_file.write_text(json.dumps({"@context": {"v": {"@id": "urn:one#"}}}))
+
+        first = to_jsonld(project, context_file=str(context_file))
+        first["@context"]["v"]["@id"] = "urn:edited#"
+        first["issues"][0]["severity"]["@id"] = "urn:edited#"
+        second = to_jsonld(project, context_file=str(context_file))
+
+        assert second["@context"]["v"]["@id"] == "urn:one#"
+        assert second["issues"][0]["severity"]["@id"].endswith("#Critical")
+
+    def test_jsonld_stream_matches_to_jsonld(self, temp_dir: Path):
+        """Streamed dump should decode to the same document as to_jsonld."""
+        from repoq.core.jsonld import dump_jsonld, to_jsonld
+        from repoq.core.model import Commit, Issue
+
+        project = Project(id="test:1", name="test")
+        for i in range(3):
+            fid = f"repo:file:f{i}.py"
+            project.files[fid] = File(id=fid, path=f"f{i}.py", contributors={"p": {"commits": 1}})
+            project.issues[f"i{i}"] = Issue(
+                id=f"i{i}", type="repo:Todo", file_id=fid, description="x\ny"
+            )
+        project.commits.append(Commit(id="c1", message="m", author_id=None, ended_at=None))
+        output_path = temp_dir / "stream.jsonld"
+
+        dump_jsonld(project, str(output_path))
+
+        expected = json.loads(json.dumps(to_jsonld(project)))
+        assert json.loads(output_path.read_text()) == expected
+
+    def test_jsonld_export_compact_by_default(self, temp_dir: Path):
+        """dump_jsonld should write compact JSON unless pretty=True."""
+        from repoq.core.jsonld import dump_jsonld
+
+        project = Project(id="test:1", name="test")
+        compact_path = temp_dir / "compact.jsonld"
+        pretty_path = temp_dir / "pretty.jsonld"
+
+        dump_jsonld(project, str(compact_path))
+        dump_jsonld(project, str(pretty_path), pretty=True)
+
+        assert "\n" not in compact_path.read_text()
+        assert pretty_path.read_text().startswith('{\n  "@context"')
+        assert json.loads(compact_path.read_text()) == json.loads(pretty_path.read_text())
+
+    def test_jsonld_export_accepts_datetimes(self, temp_dir: Path):
+        """Datetime values should serialize as UTC ISO 8601 strings."""
+        from datetime import datetime
+
+        from repoq.core.jsonld import dump_jsonld
+
+        project = Project(id="test:1", name="test")
+        project.analyzed_at = datetime(2024, 1, 2, 3, 4, 5)
+        output_path = temp_dir / "dates.jsonld"
+
+        dump_jsonld(project, str(output_path))
+
+        assert json.loads(output_path.read_text())["analyzedAt"] == "2024-01-02T03:04:05Z"
+
     def test_markdown_export(self):
         """Markdown export should work."""
         from repoq.reporting.markdown import render_markdown